@@ -5,6 +5,9 @@ The brain layer automatically discovers relevant websites from keywords.
 """
 
 import asyncio
+from collections import Counter
+from functools import lru_cache
+from operator import itemgetter
 from typing import Optional
 from dataclasses import dataclass
 
@@ -13,8 +16,13 @@ from src.brain.platform_harvester import PlatformHarvester
 from src.brain.relevance_filter import RelevanceFilter
 from src.config import config
 
+try:
+    from xxhash import xxh3_64_intdigest
+except ImportError:
+    xxh3_64_intdigest = None
 
-@dataclass
+
+@dataclass(slots=True)
 class DiscoveredSite:
     """Represents a discovered website"""
     url: str
@@ -59,25 +67,32 @@ class BrainLayer:
         Returns:
             List of discovered websites with metadata
         """
-        all_results = []
-        
-        # Phase 1: Search Aggregation
-        search_results = await self.search_aggregator.search(
-            query, 
-            max_results=max_results * 2  # Get extra for filtering
-        )
-        all_results.extend(search_results)
+        unique = {}
         
-        # Phase 2: Platform Harvesting (optional)
+        # Phase 2: Platform Harvesting (optional) - runs alongside the searches
+        harvest = None
         if include_platforms:
-            platform_results = await self.platform_harvester.harvest(query)
-            all_results.extend(platform_results)
+            harvest = asyncio.create_task(self.platform_harvester.harvest(query))
         
-        # Phase 3: Deduplication
-        unique_results = self._deduplicate(all_results)
+        try:
+            # Phase 1: Search Aggregation, with Phase 3: Deduplication done
+            # incrementally as each search source returns
+            async for search_results in self.search_aggregator.stream(
+                query, 
+                max_results=max_results * 2  # Get extra for filtering
+            ):
+                self._add_unique(unique, search_results)
+            
+            if harvest is not None:
+                self._add_unique(unique, await harvest)
+        finally:
+            if harvest is not None and not harvest.done():
+                harvest.cancel()
+        
+        unique_results = list(unique.values())
         
         # Phase 4: Relevance Filtering
-        if self.relevance_filter.is_available():
+        if await self.relevance_filter.is_available():
             filtered_results = await self.relevance_filter.filter(
                 query, 
                 unique_results, 
@@ -91,44 +106,53 @@ class BrainLayer:
         return filtered_results[:max_results]
     
     def _deduplicate(self, results: list[dict]) -> list[dict]:
-        """Remove duplicate URLs"""
-        seen_urls = set()
-        unique = []
-        
+        """Remove duplicate URLs (first occurrence wins)"""
+        unique = {}
+        self._add_unique(unique, results)
+        return list(unique.values())
+    
+    def _add_unique(self, unique: dict, results: list[dict]):
+        """Add results to `unique` (URL key -> result), skipping seen URLs"""
         for result in results:
-            url = self._normalize_url(result.get("url", ""))
-            if url and url not in seen_urls:
-                seen_urls.add(url)
-                unique.append(result)
-        
-        return unique
+            url = self._normalize_url(result.get("url") or "")
+            if url:
+                # A 64-bit digest key is much smaller than the URL string
+                key = xxh3_64_intdigest(url.encode()) if xxh3_64_intdigest else url
+                unique.setdefault(key, result)
     
     def _normalize_url(self, url: str) -> str:
-        """Normalize URL for deduplication"""
-        url = url.lower().strip()
-        # Remove trailing slash
-        if url.endswith("/"):
-            url = url[:-1]
-        # Remove query params for dedup
-        if "?" in url:
-            url = url.split("?")[0]
-        return url
+        """Normalize URL for deduplication (drop query, fragment and trailing slash)"""
+        # Lowercase last, so long query strings are cut before being copied
+        return url.strip().partition("?")[0].partition("#")[0].rstrip("/").lower()
     
     def _keyword_filter(self, query: str, results: list[dict]) -> list[dict]:
         """Simple keyword-based relevance filter"""
         keywords = query.lower().split()
+        # Scan each distinct keyword once; repeats still count per occurrence.
+        # Sorted so reworded repeats of a query share cache entries
+        weights = tuple(sorted(Counter(keywords).items()))
         scored = []
         
         for result in results:
-            text = f"{result.get('title', '')} {result.get('snippet', '')}".lower()
-            matches = sum(1 for kw in keywords if kw in text)
-            score = matches / len(keywords) if keywords else 0
+            text = f"{result.get('title', '')} {result.get('snippet', '')}"
+            score = self._keyword_score(weights, text)
             result["relevance_score"] = score
             if score > 0.3:
                 scored.append(result)
         
         # Sort by relevance
-        return sorted(scored, key=lambda x: x.get("relevance_score", 0), reverse=True)
+        return sorted(scored, key=itemgetter("relevance_score"), reverse=True)
+    
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _keyword_score(weights: tuple[tuple[str, int], ...], text: str) -> float:
+        """Share of query keywords found in text (cached - repeat queries see the same results)"""
+        total = sum(n for _, n in weights)
+        if not total:
+            return 0
+        
+        text = text.lower()
+        return sum(n for kw, n in weights if kw in text) / total
 
 
 async def main():
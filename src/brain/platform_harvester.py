@@ -12,6 +12,7 @@ import asyncio
 import re
 import httpx
 from typing import Optional
+from src.config import config
 
 
 class PlatformHarvester:
@@ -22,13 +23,29 @@ class PlatformHarvester:
     This module extracts their direct websites from platform profiles.
     """
     
+    # Seller/shop link patterns (each ends on the closing quote, so a
+    # match is never a truncated link)
+    AMAZON_SELLER_PATTERN = re.compile(r'href="(/sp\?seller=[A-Z0-9]+)"')
+    EBAY_SELLER_PATTERN = re.compile(r'href="(https://www\.ebay\.com/usr/[^"]+)"')
+    ETSY_SHOP_PATTERN = re.compile(r'href="(https://www\.etsy\.com/shop/[^"?]+)"')
+    
+    # Characters carried between chunks so links split across chunks match
+    STREAM_TAIL = 512
+    
     def __init__(self):
+        max_concurrency = config.scraper.max_concurrency
         self.client = httpx.AsyncClient(
             timeout=30.0,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency
+            ),
             headers={
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
             }
         )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
     
     async def harvest(self, query: str, max_per_platform: int = 20) -> list[dict]:
         """
@@ -68,22 +85,19 @@ class PlatformHarvester:
             
             # Note: Amazon heavily blocks scrapers
             # In production, use Bright Data or similar
-            response = await self.client.get(search_url)
             
-            if response.status_code == 200:
-                # Extract seller links (simplified regex)
-                seller_links = re.findall(
-                    r'href="(/sp\?seller=[A-Z0-9]+)"', 
-                    response.text
-                )
-                
-                for link in seller_links[:max_results]:
-                    results.append({
-                        "url": f"https://www.amazon.com{link}",
-                        "title": "Amazon Seller",
-                        "snippet": f"Found via Amazon search: {query}",
-                        "source": "amazon"
-                    })
+            # Extract seller links (simplified regex)
+            seller_links = await self._stream_links(
+                search_url, self.AMAZON_SELLER_PATTERN, max_results
+            )
+            
+            for link in seller_links:
+                results.append({
+                    "url": f"https://www.amazon.com{link}",
+                    "title": "Amazon Seller",
+                    "snippet": f"Found via Amazon search: {query}",
+                    "source": "amazon"
+                })
         except Exception as e:
             print(f"Amazon harvest error: {e}")
         
@@ -95,22 +109,19 @@ class PlatformHarvester:
         
         try:
             search_url = f"https://www.ebay.com/sch/i.html?_nkw={query.replace(' ', '+')}"
-            response = await self.client.get(search_url)
             
-            if response.status_code == 200:
-                # Extract seller profile links
-                seller_links = re.findall(
-                    r'href="(https://www\.ebay\.com/usr/[^"]+)"',
-                    response.text
-                )
-                
-                for link in list(set(seller_links))[:max_results]:
-                    results.append({
-                        "url": link,
-                        "title": "eBay Seller",
-                        "snippet": f"Found via eBay search: {query}",
-                        "source": "ebay"
-                    })
+            # Extract seller profile links
+            seller_links = await self._stream_links(
+                search_url, self.EBAY_SELLER_PATTERN, max_results
+            )
+            
+            for link in seller_links:
+                results.append({
+                    "url": link,
+                    "title": "eBay Seller",
+                    "snippet": f"Found via eBay search: {query}",
+                    "source": "ebay"
+                })
         except Exception as e:
             print(f"eBay harvest error: {e}")
         
@@ -122,27 +133,62 @@ class PlatformHarvester:
         
         try:
             search_url = f"https://www.etsy.com/search?q={query.replace(' ', '+')}"
-            response = await self.client.get(search_url)
             
-            if response.status_code == 200:
-                # Extract shop links
-                shop_links = re.findall(
-                    r'href="(https://www\.etsy\.com/shop/[^"?]+)"',
-                    response.text
-                )
-                
-                for link in list(set(shop_links))[:max_results]:
-                    results.append({
-                        "url": link,
-                        "title": "Etsy Shop",
-                        "snippet": f"Found via Etsy search: {query}",
-                        "source": "etsy"
-                    })
+            # Extract shop links
+            shop_links = await self._stream_links(
+                search_url, self.ETSY_SHOP_PATTERN, max_results
+            )
+            
+            for link in shop_links:
+                results.append({
+                    "url": link,
+                    "title": "Etsy Shop",
+                    "snippet": f"Found via Etsy search: {query}",
+                    "source": "etsy"
+                })
         except Exception as e:
             print(f"Etsy harvest error: {e}")
         
         return results
     
+    async def _stream_links(
+        self,
+        url: str,
+        pattern: re.Pattern,
+        max_results: int
+    ) -> list[str]:
+        """
+        Stream a search page and collect unique links matching pattern.
+        
+        Stops downloading as soon as max_results links are found, so
+        large marketplace pages are rarely read in full.
+        """
+        links = {}
+        
+        async with self._semaphore:
+            async with self.client.stream("GET", url) as response:
+                if response.status_code != 200:
+                    return []
+                
+                buffer = ""
+                async for chunk in response.aiter_text():
+                    buffer += chunk
+                    last_end = 0
+                    
+                    for match in pattern.finditer(buffer):
+                        last_end = match.end()
+                        link = match.group(1)
+                        if link not in links:
+                            # dict keeps first-seen order
+                            links[link] = None
+                            if len(links) >= max_results:
+                                return list(links)
+                    
+                    # Keep an unmatched tail for links split across chunks
+                    buffer = buffer[max(last_end, len(buffer) - self.STREAM_TAIL):]
+        
+        return list(links)
+    
     async def close(self):
         """Close HTTP client"""
         await self.client.aclose()
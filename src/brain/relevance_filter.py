@@ -1,40 +1,92 @@
 """
 Relevance Filter - LLM-Based Relevance Scoring
 
-Uses Ollama (local LLM) to score relevance of discovered websites.
+Scores relevance of discovered websites with a local cross-encoder
+reranker, falling back to Ollama (local LLM) when it is unavailable.
 """
 
-import json
+import asyncio
+import time
+from operator import itemgetter
 from typing import Optional
 import httpx
 from src.config import config
+from src.utils.fast_json import loads, dumps
+from src.brain.score_cache import ScoreCache
+from src.brain.reranker import Reranker
+
+
+# Fixed scoring instructions - kept byte-identical across calls so Ollama
+# can reuse the prefix KV cache
+SCORING_INSTRUCTIONS = """You are scoring websites for relevance to a search query.
+
+For each website, score its relevance from 0.0 to 1.0:
+- 1.0 = Perfectly relevant (exact match to query intent)
+- 0.7 = Highly relevant (related to query)
+- 0.5 = Somewhat relevant (tangentially related)
+- 0.3 = Low relevance (barely related)
+- 0.0 = Not relevant (spam, wrong topic)
+
+Return ONLY a JSON object with scores like:
+{"scores": [0.9, 0.7, 0.3, ...]}
+
+No explanation needed, just the JSON."""
 
 
 class RelevanceFilter:
     """
-    LLM-powered relevance filtering using Ollama.
+    Relevance filtering with a local cross-encoder, or Ollama as fallback.
     
     Scores each discovered website for relevance to the original query,
     filtering out noise and focusing on high-quality leads.
     """
     
+    # Seconds an Ollama availability probe result is reused
+    AVAILABILITY_TTL = 60.0
+    
     def __init__(self):
-        self.client = httpx.AsyncClient(timeout=60.0)
-        self.model = config.llm.model_name
-        self._available = None
+        max_concurrency = config.scraper.max_concurrency
+        self.client = httpx.AsyncClient(
+            timeout=60.0,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency
+            )
+        )
+        # Bounded by GPU capacity rather than HTTP concurrency
+        self._semaphore = asyncio.Semaphore(config.llm.ollama_num_parallel)
+        self.model = config.llm.ollama_model
+        self._available = False
+        self._available_expiry = 0.0
+        self.cache = ScoreCache()
+        self.reranker = Reranker()
     
-    def is_available(self) -> bool:
-        """Check if Ollama is available"""
-        if self._available is not None:
+    async def is_available(self) -> bool:
+        """Check if a scorer (local reranker or Ollama) is available"""
+        if await self._reranker_available():
+            return True
+        return await self._ollama_available()
+    
+    async def _reranker_available(self) -> bool:
+        """Check the reranker (first call loads the model off the event loop)"""
+        return await asyncio.to_thread(self.reranker.is_available)
+    
+    async def _ollama_available(self) -> bool:
+        """Check if Ollama is available (probe cached for AVAILABILITY_TTL)"""
+        if time.monotonic() < self._available_expiry:
             return self._available
         
         try:
-            import httpx
-            response = httpx.get(f"{config.llm.ollama_host}/api/tags", timeout=5.0)
+            response = await self.client.get(
+                f"{config.llm.ollama_host}/api/tags",
+                timeout=2.0
+            )
             self._available = response.status_code == 200
-        except:
+        except Exception:
             self._available = False
         
+        self._available_expiry = time.monotonic() + self.AVAILABILITY_TTL
         return self._available
     
     async def filter(
@@ -56,86 +108,109 @@ class RelevanceFilter:
         Returns:
             Filtered list of relevant websites
         """
-        if not self.is_available():
+        if not await self.is_available():
             return results
         
         scored_results = []
         
-        # Process in batches
-        for i in range(0, len(results), batch_size):
-            batch = results[i:i + batch_size]
-            scores = await self._score_batch(query, batch)
-            
+        # Score all batches concurrently (throttled by the semaphore)
+        batches = [results[i:i + batch_size] for i in range(0, len(results), batch_size)]
+        batched_scores = await asyncio.gather(
+            *(self._score_batch(query, batch) for batch in batches)
+        )
+        
+        for batch, scores in zip(batches, batched_scores):
             for result, score in zip(batch, scores):
                 result["relevance_score"] = score
                 if score >= threshold:
                     scored_results.append(result)
         
         # Sort by relevance
-        return sorted(
-            scored_results, 
-            key=lambda x: x.get("relevance_score", 0), 
-            reverse=True
-        )
+        return sorted(scored_results, key=itemgetter("relevance_score"), reverse=True)
     
     async def _score_batch(self, query: str, results: list[dict]) -> list[float]:
-        """Score a batch of results"""
-        prompt = self._build_prompt(query, results)
+        """Score a batch of results, sending only cache misses to the LLM"""
+        scores = await self.cache.lookup(query, results)
+        pending = [r for r, s in zip(results, scores) if s is None]
+        
+        if pending:
+            if await self._reranker_available():
+                fresh = await self._score_with_reranker(query, pending)
+            else:
+                fresh = await self._score_with_llm(query, pending)
+            if fresh is None:
+                # Fallback: neutral scores, not cached
+                fresh = [0.5] * len(pending)
+            else:
+                await self.cache.store(query, pending, fresh)
+            
+            fresh_iter = iter(fresh)
+            scores = [s if s is not None else next(fresh_iter) for s in scores]
         
+        return scores
+    
+    async def _score_with_reranker(self, query: str, results: list[dict]) -> Optional[list[float]]:
+        """Score results with the local cross-encoder, None on failure"""
         try:
-            response = await self.client.post(
-                f"{config.llm.ollama_host}/api/generate",
-                json={
-                    "model": self.model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "format": "json"
-                }
-            )
+            async with self._semaphore:
+                return await asyncio.to_thread(self.reranker.score, query, results)
+        except Exception as e:
+            print(f"Reranker scoring error: {e}")
+        
+        return None
+    
+    async def _score_with_llm(self, query: str, results: list[dict]) -> Optional[list[float]]:
+        """Score results with the LLM, None on failure"""
+        try:
+            async with self._semaphore:
+                response = await self.client.post(
+                    f"{config.llm.ollama_host}/api/chat",
+                    content=dumps({
+                        "model": self.model,
+                        "messages": self._build_messages(query, results),
+                        "stream": False,
+                        "format": "json",
+                        "keep_alive": config.llm.ollama_keep_alive,
+                        "options": {"num_ctx": config.llm.ollama_num_ctx}
+                    }),
+                    headers={"Content-Type": "application/json"}
+                )
             
             if response.status_code == 200:
-                data = response.json()
-                return self._parse_scores(data.get("response", ""), len(results))
+                data = loads(response.content)
+                content = data.get("message", {}).get("content", "")
+                return self._parse_scores(content, len(results))
         except Exception as e:
             print(f"LLM scoring error: {e}")
         
-        # Fallback: return neutral scores
-        return [0.5] * len(results)
+        return None
     
-    def _build_prompt(self, query: str, results: list[dict]) -> str:
-        """Build scoring prompt for LLM"""
+    def _build_messages(self, query: str, results: list[dict]) -> list[dict]:
+        """
+        Build chat messages for LLM scoring.
+        
+        The system message (instructions + query) is the same for every
+        batch of a query; only the websites list changes per batch.
+        """
         sites = []
         for i, r in enumerate(results):
             sites.append(f"{i+1}. {r.get('title', 'N/A')} - {r.get('url', 'N/A')}")
-            if r.get('snippet'):
-                sites.append(f"   {r.get('snippet', '')[:100]}")
+            snippet = r.get('snippet')
+            if snippet:
+                sites.append(f"   {snippet[:100]}")
         
         sites_text = "\n".join(sites)
         
-        return f"""You are scoring websites for relevance to a search query.
-
-QUERY: "{query}"
-
-WEBSITES:
-{sites_text}
-
-For each website, score its relevance from 0.0 to 1.0:
-- 1.0 = Perfectly relevant (exact match to query intent)
-- 0.7 = Highly relevant (related to query)
-- 0.5 = Somewhat relevant (tangentially related)
-- 0.3 = Low relevance (barely related)
-- 0.0 = Not relevant (spam, wrong topic)
-
-Return ONLY a JSON object with scores like:
-{{"scores": [0.9, 0.7, 0.3, ...]}}
-
-No explanation needed, just the JSON."""
-
+        return [
+            {"role": "system", "content": f'{SCORING_INSTRUCTIONS}\n\nQUERY: "{query}"'},
+            {"role": "user", "content": f"WEBSITES:\n{sites_text}"}
+        ]
+    
     def _parse_scores(self, response: str, expected_count: int) -> list[float]:
         """Parse scores from LLM response"""
         try:
             # Try to parse JSON
-            data = json.loads(response)
+            data = loads(response)
             scores = data.get("scores", [])
             
             # Validate and pad if needed
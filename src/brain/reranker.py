@@ -0,0 +1,72 @@
+"""
+Reranker - Local Cross-Encoder Relevance Scoring
+
+Scores (query, website) pairs with a small int8-quantized cross-encoder
+instead of LLM JSON generation.
+"""
+
+import threading
+from typing import Optional
+from src.config import config
+
+
+class Reranker:
+    """
+    Cross-encoder relevance scorer running on CPU.
+    
+    Linear layers are dynamically quantized to int8 after loading. Needs
+    sentence-transformers; without it the reranker reports unavailable
+    and RelevanceFilter falls back to Ollama.
+    """
+    
+    def __init__(self, model_name: Optional[str] = None):
+        self.model_name = model_name or config.llm.reranker_model
+        self._model = None
+        self._model_loaded = False
+        self._load_lock = threading.Lock()
+    
+    def is_available(self) -> bool:
+        """Check if the cross-encoder can be loaded"""
+        return self._get_model() is not None
+    
+    def score(self, query: str, results: list[dict]) -> list[float]:
+        """
+        Score results for relevance to query.
+        
+        Returns:
+            One score per result in 0-1
+        """
+        model = self._get_model()
+        pairs = [(query, self._result_text(r)) for r in results]
+        return [float(s) for s in model.predict(pairs)]
+    
+    def _result_text(self, result: dict) -> str:
+        """Text the cross-encoder sees for a result"""
+        title = result.get("title") or ""
+        snippet = result.get("snippet") or ""
+        return f"{title} - {result.get('url') or ''}\n{snippet}"
+    
+    def _get_model(self):
+        """Lazy-load and quantize the cross-encoder"""
+        with self._load_lock:
+            if not self._model_loaded:
+                self._model_loaded = True
+                try:
+                    import torch
+                    from sentence_transformers import CrossEncoder
+                    
+                    # Sigmoid maps logits onto the 0-1 scale the filter thresholds use
+                    model = CrossEncoder(
+                        self.model_name,
+                        device="cpu",
+                        default_activation_function=torch.nn.Sigmoid()
+                    )
+                    model.model = torch.quantization.quantize_dynamic(
+                        model.model, {torch.nn.Linear}, dtype=torch.qint8
+                    )
+                    self._model = model
+                except Exception as e:
+                    # sentence-transformers/torch missing or model unavailable
+                    print(f"Reranker unavailable: {e}")
+                    self._model = None
+            return self._model
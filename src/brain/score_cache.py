@@ -0,0 +1,138 @@
+"""
+Score Cache - Semantic Cache for LLM Relevance Scores
+
+Avoids re-scoring the same (query, website) pairs with the LLM.
+"""
+
+import asyncio
+import hashlib
+from collections import OrderedDict
+from typing import Optional
+
+
+class ScoreCache:
+    """
+    Two-tier cache in front of the LLM relevance scorer.
+    
+    Tiers:
+    1. Exact - SHA-256 of the canonical (query, url, title) triple
+    2. Semantic - a new query whose embedding is within `threshold`
+       cosine similarity of an earlier query reuses that query's scores
+    
+    The semantic tier needs sentence-transformers; without it only
+    exact hits are served. Loading the model and embedding a query run in
+    a worker thread, so they never block the event loop.
+    """
+    
+    def __init__(
+        self,
+        threshold: float = 0.87,
+        model_name: str = "all-MiniLM-L6-v2",
+        max_entries: int = 50_000,
+        max_queries: int = 1024,
+        max_resolved: int = 4096
+    ):
+        self.threshold = threshold
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self.max_queries = max_queries
+        self.max_resolved = max_resolved
+        
+        self._scores: dict[str, float] = {}
+        # Normalized query -> canonical query (LRU, max_resolved entries)
+        self._resolved: OrderedDict[str, str] = OrderedDict()
+        # Serializes embedding lookups - _queries/_vectors aren't thread-safe
+        self._embed_lock = asyncio.Lock()
+        self._queries: list[str] = []
+        self._vectors = None
+        self._model = None
+        self._model_loaded = False
+    
+    async def lookup(self, query: str, results: list[dict]) -> list[Optional[float]]:
+        """
+        Get cached scores for results.
+        
+        Returns:
+            One score per result, None where the result is not cached
+        """
+        canonical = await self._resolve_query(query)
+        return [self._scores.get(self._key(canonical, r)) for r in results]
+    
+    async def store(self, query: str, results: list[dict], scores: list[float]):
+        """Cache LLM scores for results"""
+        canonical = await self._resolve_query(query)
+        
+        for result, score in zip(results, scores):
+            self._scores[self._key(canonical, result)] = score
+        
+        # Evict oldest entries (dicts keep insertion order)
+        while len(self._scores) > self.max_entries:
+            del self._scores[next(iter(self._scores))]
+    
+    def clear(self):
+        """Clear all cached scores and queries"""
+        self._scores.clear()
+        self._resolved.clear()
+        self._queries.clear()
+        self._vectors = None
+    
+    def _key(self, query: str, result: dict) -> str:
+        """Exact-tier key for a (query, result) pair"""
+        raw = f"{query}\n{result.get('url') or ''}\n{result.get('title') or ''}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+    
+    async def _resolve_query(self, query: str) -> str:
+        """Map a query onto a semantically equivalent earlier query"""
+        canonical = " ".join(query.lower().split())
+        
+        resolved = self._resolved.get(canonical)
+        if resolved is None:
+            async with self._embed_lock:
+                # Another batch may have resolved it while this one waited
+                resolved = self._resolved.get(canonical)
+                if resolved is None:
+                    resolved = await asyncio.to_thread(self._nearest_query, canonical) or canonical
+                    self._resolved[canonical] = resolved
+        
+        self._resolved.move_to_end(canonical)
+        if len(self._resolved) > self.max_resolved:
+            self._resolved.popitem(last=False)
+        return resolved
+    
+    def _nearest_query(self, query: str) -> Optional[str]:
+        """Find a stored query above the similarity threshold"""
+        model = self._get_model()
+        if model is None:
+            return None
+        
+        import numpy as np
+        
+        vector = model.encode([query], normalize_embeddings=True)[0].astype(np.float32)
+        
+        if self._vectors is not None:
+            similarities = self._vectors @ vector
+            best = int(np.argmax(similarities))
+            if similarities[best] >= self.threshold:
+                return self._queries[best]
+        
+        # New query - remember its embedding
+        if len(self._queries) < self.max_queries:
+            self._queries.append(query)
+            if self._vectors is None:
+                self._vectors = vector[np.newaxis, :]
+            else:
+                self._vectors = np.vstack([self._vectors, vector])
+        
+        return None
+    
+    def _get_model(self):
+        """Lazy-load the sentence embedding model"""
+        if not self._model_loaded:
+            self._model_loaded = True
+            try:
+                from sentence_transformers import SentenceTransformer
+                self._model = SentenceTransformer(self.model_name)
+            except Exception:
+                # sentence-transformers missing or model unavailable
+                self._model = None
+        return self._model
@@ -10,8 +10,9 @@ Aggregates results from multiple search APIs:
 
 import asyncio
 import httpx
-from typing import Optional
+from typing import AsyncIterator, Optional
 from src.config import config
+from src.utils.fast_json import loads
 
 
 class SearchAggregator:
@@ -25,7 +26,16 @@ class SearchAggregator:
     """
     
     def __init__(self):
-        self.client = httpx.AsyncClient(timeout=30.0)
+        max_concurrency = config.scraper.max_concurrency
+        self.client = httpx.AsyncClient(
+            timeout=30.0,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency
+            )
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
     
     async def search(self, query: str, max_results: int = 100) -> list[dict]:
         """
@@ -38,7 +48,44 @@ class SearchAggregator:
         Returns:
             Aggregated search results
         """
-        # Run all searches in parallel
+        # Gather all results
+        results = await asyncio.gather(
+            *self._searches(query, max_results),
+            return_exceptions=True
+        )
+        
+        # Flatten and combine
+        all_results = []
+        for result in results:
+            if isinstance(result, list):
+                all_results.extend(result)
+            elif isinstance(result, Exception):
+                # Log but continue
+                print(f"Search error: {result}")
+        
+        return all_results
+    
+    async def stream(self, query: str, max_results: int = 100) -> AsyncIterator[list[dict]]:
+        """
+        Search across all available sources, yielding each source's
+        results as soon as that source finishes.
+        
+        Args:
+            query: Search query
+            max_results: Maximum results per source
+        
+        Yields:
+            One list of results per source (in completion order)
+        """
+        for search in asyncio.as_completed(self._searches(query, max_results)):
+            try:
+                yield await search
+            except Exception as e:
+                # Log but continue
+                print(f"Search error: {e}")
+    
+    def _searches(self, query: str, max_results: int) -> list:
+        """Search coroutines for every available source"""
         tasks = []
         
         if config.search.serper_api_key:
@@ -53,33 +100,22 @@ class SearchAggregator:
         # Always include free sources
         tasks.append(self._search_duckduckgo(query, max_results))
         
-        # Gather all results
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Flatten and combine
-        all_results = []
-        for result in results:
-            if isinstance(result, list):
-                all_results.extend(result)
-            elif isinstance(result, Exception):
-                # Log but continue
-                print(f"Search error: {result}")
-        
-        return all_results
+        return tasks
     
     async def _search_serper(self, query: str, max_results: int) -> list[dict]:
         """Search using Serper.dev (Google results)"""
         try:
-            response = await self.client.post(
-                "https://google.serper.dev/search",
-                headers={"X-API-KEY": config.search.serper_api_key},
-                json={
-                    "q": query,
-                    "num": min(max_results, 100)
-                }
-            )
+            async with self._semaphore:
+                response = await self.client.post(
+                    "https://google.serper.dev/search",
+                    headers={"X-API-KEY": config.search.serper_api_key},
+                    json={
+                        "q": query,
+                        "num": min(max_results, 100)
+                    }
+                )
             response.raise_for_status()
-            data = response.json()
+            data = loads(response.content)
             
             results = []
             for item in data.get("organic", []):
@@ -97,16 +133,17 @@ class SearchAggregator:
     async def _search_bing(self, query: str, max_results: int) -> list[dict]:
         """Search using Bing Web Search API"""
         try:
-            response = await self.client.get(
-                "https://api.bing.microsoft.com/v7.0/search",
-                headers={"Ocp-Apim-Subscription-Key": config.search.bing_api_key},
-                params={
-                    "q": query,
-                    "count": min(max_results, 50)
-                }
-            )
+            async with self._semaphore:
+                response = await self.client.get(
+                    "https://api.bing.microsoft.com/v7.0/search",
+                    headers={"Ocp-Apim-Subscription-Key": config.search.bing_api_key},
+                    params={
+                        "q": query,
+                        "count": min(max_results, 50)
+                    }
+                )
             response.raise_for_status()
-            data = response.json()
+            data = loads(response.content)
             
             results = []
             for item in data.get("webPages", {}).get("value", []):
@@ -124,19 +161,20 @@ class SearchAggregator:
     async def _search_brave(self, query: str, max_results: int) -> list[dict]:
         """Search using Brave Search API"""
         try:
-            response = await self.client.get(
-                "https://api.search.brave.com/res/v1/web/search",
-                headers={
-                    "X-Subscription-Token": config.search.brave_api_key,
-                    "Accept": "application/json"
-                },
-                params={
-                    "q": query,
-                    "count": min(max_results, 20)
-                }
-            )
+            async with self._semaphore:
+                response = await self.client.get(
+                    "https://api.search.brave.com/res/v1/web/search",
+                    headers={
+                        "X-Subscription-Token": config.search.brave_api_key,
+                        "Accept": "application/json"
+                    },
+                    params={
+                        "q": query,
+                        "count": min(max_results, 20)
+                    }
+                )
             response.raise_for_status()
-            data = response.json()
+            data = loads(response.content)
             
             results = []
             for item in data.get("web", {}).get("results", []):
@@ -155,15 +193,16 @@ class SearchAggregator:
         """Search using DuckDuckGo (free, no API key)"""
         try:
             # DuckDuckGo instant answer API (limited but free)
-            response = await self.client.get(
-                "https://api.duckduckgo.com/",
-                params={
-                    "q": query,
-                    "format": "json",
-                    "no_html": 1
-                }
-            )
-            data = response.json()
+            async with self._semaphore:
+                response = await self.client.get(
+                    "https://api.duckduckgo.com/",
+                    params={
+                        "q": query,
+                        "format": "json",
+                        "no_html": 1
+                    }
+                )
+            data = loads(response.content)
             
             results = []
             
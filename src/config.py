@@ -4,13 +4,16 @@ Max Speed Web Scraper - Configuration
 
 import os
 from pathlib import Path
-from typing import Optional
+from typing import ClassVar, Optional
 from dataclasses import dataclass, field
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Project root (resolved once)
+BASE_DIR = Path(__file__).parent.parent
+
 
 @dataclass
 class SearchConfig:
@@ -56,6 +59,12 @@ class LLMConfig:
     # Ollama (local)
     ollama_host: str = field(default_factory=lambda: os.getenv("OLLAMA_HOST", "http://localhost:11434"))
     ollama_model: str = "llama3.2"
+    ollama_keep_alive: str = field(default_factory=lambda: os.getenv("OLLAMA_KEEP_ALIVE", "10m"))
+    ollama_num_ctx: int = field(default_factory=lambda: int(os.getenv("OLLAMA_NUM_CTX", "4096")))
+    ollama_num_parallel: int = field(default_factory=lambda: int(os.getenv("OLLAMA_NUM_PARALLEL", "4")))
+    
+    # Local cross-encoder reranker (preferred over Ollama for scoring)
+    reranker_model: str = field(default_factory=lambda: os.getenv("RERANKER_MODEL", "cross-encoder/ms-marco-MiniLM-L-6-v2"))
     
     # Groq (cloud, fast, free tier)
     groq_api_key: Optional[str] = field(default_factory=lambda: os.getenv("GROQ_API_KEY"))
@@ -88,16 +97,20 @@ class Config:
     scraper: ScraperConfig = field(default_factory=ScraperConfig)
     
     # Project paths
-    base_dir: Path = field(default_factory=lambda: Path(__file__).parent.parent)
-    logs_dir: Path = field(default_factory=lambda: Path(__file__).parent.parent / "logs")
-    cache_dir: Path = field(default_factory=lambda: Path(__file__).parent.parent / ".cache")
-    downloads_dir: Path = field(default_factory=lambda: Path(__file__).parent.parent / "downloads")
+    base_dir: Path = BASE_DIR
+    logs_dir: Path = BASE_DIR / "logs"
+    cache_dir: Path = BASE_DIR / ".cache"
+    downloads_dir: Path = BASE_DIR / "downloads"
+    
+    # Directories already created in this process
+    _created_dirs: ClassVar[set[Path]] = set()
     
     def __post_init__(self):
-        # Create directories if they don't exist
-        self.logs_dir.mkdir(exist_ok=True)
-        self.cache_dir.mkdir(exist_ok=True)
-        self.downloads_dir.mkdir(exist_ok=True)
+        # Create directories if they don't exist (once per process)
+        for directory in (self.logs_dir, self.cache_dir, self.downloads_dir):
+            if directory not in Config._created_dirs:
+                directory.mkdir(exist_ok=True)
+                Config._created_dirs.add(directory)
 
 
 # Global config instance
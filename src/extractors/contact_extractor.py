@@ -6,6 +6,12 @@ Extracts contact information (phones, addresses) from web pages.
 
 import re
 from typing import Optional
+from src.extractors.pattern_scanner import PatternScanner
+
+try:
+    import phonenumbers
+except ImportError:
+    phonenumbers = None
 
 
 class ContactExtractor:
@@ -36,12 +42,25 @@ class ContactExtractor:
         re.compile(r'[A-Z]{1,2}\d[A-Z\d]?\s*\d[A-Z]{2}', re.IGNORECASE),
     ]
     
-    # Ignore patterns (false positives)
-    IGNORE_PHONE_PATTERNS = [
-        r'^\d{3,4}$',  # Too short
-        r'^1[2-9]\d{2}$',  # Year-like
-        r'^\d{10,}$',  # No formatting
-    ]
+    # Single-pass alternations of the patterns above
+    COMBINED_PHONE_PATTERN = re.compile(
+        "|".join(f"(?:{p.pattern})" for p in PHONE_PATTERNS)
+    )
+    COMBINED_ADDRESS_PATTERN = re.compile(
+        "|".join(f"(?:{p.pattern})" for p in ADDRESS_PATTERNS),
+        re.IGNORECASE
+    )
+    
+    # Hyperscan scanner for phone + address patterns (compiled lazily)
+    SCANNER = PatternScanner([PHONE_PATTERNS, ADDRESS_PATTERNS])
+    
+    # HTML tags (replaced with spaces before scanning)
+    TAG_PATTERN = re.compile(r'<[^>]+>')
+    
+    # Deletes every non-digit character (phone candidates are ASCII)
+    NON_DIGIT_TABLE = str.maketrans(
+        "", "", "".join(chr(c) for c in range(256) if not chr(c).isdecimal())
+    )
     
     def extract_phones(self, content: str) -> list[str]:
         """
@@ -53,19 +72,7 @@ class ContactExtractor:
         Returns:
             List of phone numbers
         """
-        phones = set()
-        
-        # Clean HTML tags
-        text = re.sub(r'<[^>]+>', ' ', content)
-        
-        for pattern in self.PHONE_PATTERNS:
-            matches = pattern.findall(text)
-            for match in matches:
-                phone = self._clean_phone(match)
-                if phone and self._is_valid_phone(phone):
-                    phones.add(phone)
-        
-        return list(phones)
+        return self._find_phones(self._strip_tags(content))
     
     def extract_addresses(self, content: str) -> list[str]:
         """
@@ -77,32 +84,79 @@ class ContactExtractor:
         Returns:
             List of addresses
         """
-        addresses = set()
-        
-        # Clean HTML tags
-        text = re.sub(r'<[^>]+>', ' ', content)
-        
-        for pattern in self.ADDRESS_PATTERNS:
-            matches = pattern.findall(text)
-            for match in matches:
-                address = self._clean_address(match)
-                if address:
-                    addresses.add(address)
-        
-        return list(addresses)
+        return self._find_addresses(self._strip_tags(content))
     
     def extract_all(self, content: str) -> dict:
         """
         Extract all contact information.
         
+        Tags are stripped once and the plain text is shared by
+        the phone and address scans. When hyperscan is installed both
+        pattern families are located in a single DFA pass and `re` only
+        runs over the matched regions.
+        
         Returns:
             Dict with phones, addresses, postal_codes
         """
+        text = self._strip_tags(content)
+        
+        regions = self.SCANNER.scan(text)
+        if regions is None:
+            return {
+                "phones": self._find_phones(text),
+                "addresses": self._find_addresses(text)
+            }
+        
+        phone_regions, address_regions = regions
         return {
-            "phones": self.extract_phones(content),
-            "addresses": self.extract_addresses(content)
+            "phones": self._collect_phones(
+                m.group() for region in phone_regions
+                for m in self.COMBINED_PHONE_PATTERN.finditer(region)
+            ),
+            "addresses": self._collect_addresses(
+                m.group() for region in address_regions
+                for m in self.COMBINED_ADDRESS_PATTERN.finditer(region)
+            )
         }
     
+    def _strip_tags(self, content: str) -> str:
+        """Replace HTML tags with spaces in a single pass"""
+        return self.TAG_PATTERN.sub(' ', content)
+    
+    def _find_phones(self, text: str) -> list[str]:
+        """Find phone numbers in tag-stripped text"""
+        return self._collect_phones(
+            m.group() for m in self.COMBINED_PHONE_PATTERN.finditer(text)
+        )
+    
+    def _find_addresses(self, text: str) -> list[str]:
+        """Find addresses in tag-stripped text"""
+        return self._collect_addresses(
+            m.group() for m in self.COMBINED_ADDRESS_PATTERN.finditer(text)
+        )
+    
+    def _collect_phones(self, matches) -> list[str]:
+        """Clean, validate and deduplicate raw phone matches"""
+        phones = set()
+        
+        for match in matches:
+            phone = self._clean_phone(match)
+            if phone and self._is_valid_phone(phone):
+                phones.add(phone)
+        
+        return list(phones)
+    
+    def _collect_addresses(self, matches) -> list[str]:
+        """Clean and deduplicate raw address matches"""
+        addresses = set()
+        
+        for match in matches:
+            address = self._clean_address(match)
+            if address:
+                addresses.add(address)
+        
+        return list(addresses)
+    
     def _clean_phone(self, phone: str) -> str:
         """Clean and normalize phone number"""
         # Remove extra whitespace
@@ -118,16 +172,15 @@ class ContactExtractor:
     def _is_valid_phone(self, phone: str) -> bool:
         """Validate phone number"""
         # Remove formatting
-        digits = re.sub(r'\D', '', phone)
+        digits = phone.translate(self.NON_DIGIT_TABLE)
         
         # Check length (7-15 digits)
-        if len(digits) < 7 or len(digits) > 15:
+        if not 7 <= len(digits) <= 15:
             return False
         
-        # Check for obvious invalid patterns
-        for pattern in self.IGNORE_PHONE_PATTERNS:
-            if re.match(pattern, digits):
-                return False
+        # A bare run of 10+ digits is more likely an ID than a phone
+        if phone.isdigit() and len(phone) >= 10:
+            return False
         
         return True
 
@@ -139,7 +192,6 @@ class PhoneNumberParser:
     def format_e164(phone: str, default_country: str = "US") -> Optional[str]:
         """Format phone number in E.164 format"""
         try:
-            import phonenumbers
             parsed = phonenumbers.parse(phone, default_country)
             if phonenumbers.is_valid_number(parsed):
                 return phonenumbers.format_number(
@@ -154,9 +206,31 @@ class PhoneNumberParser:
     def get_country(phone: str, default_country: str = "US") -> Optional[str]:
         """Get country code from phone number"""
         try:
-            import phonenumbers
             parsed = phonenumbers.parse(phone, default_country)
             return phonenumbers.region_code_for_number(parsed)
         except:
             pass
         return None
+    
+    @staticmethod
+    def extract_and_validate_phones(text: str, country: str = "US") -> list[str]:
+        """
+        Find valid phone numbers in text in a single matcher pass.
+        
+        Args:
+            text: Plain text (strip HTML first)
+            country: Region used for numbers without a country code
+        
+        Returns:
+            Unique phone numbers in E.164 format, in order of appearance
+        """
+        if phonenumbers is None:
+            return []
+        
+        e164 = phonenumbers.PhoneNumberFormat.E164
+        phones = {}
+        
+        for match in phonenumbers.PhoneNumberMatcher(text, country):
+            phones[phonenumbers.format_number(match.number, e164)] = None
+        
+        return list(phones)
@@ -6,6 +6,7 @@ Extracts and validates email addresses from HTML content.
 
 import re
 from typing import Optional
+from src.extractors.pattern_scanner import PatternScanner, linear_time
 
 
 class EmailExtractor:
@@ -25,8 +26,14 @@ class EmailExtractor:
         re.IGNORECASE
     )
     
+    # Linear-time matcher for EMAIL_PATTERN (RE2 when installed)
+    EMAIL_MATCHER = linear_time(EMAIL_PATTERN)
+    
+    # Hyperscan prefilter for the email pattern (compiled lazily)
+    SCANNER = PatternScanner([[EMAIL_PATTERN]])
+    
     # False positive domains to filter
-    IGNORE_DOMAINS = {
+    IGNORE_DOMAINS = frozenset({
         "example.com",
         "email.com", 
         "domain.com",
@@ -35,17 +42,10 @@ class EmailExtractor:
         "sentry.io",
         "wixpress.com",
         "placeholder.com",
-    }
+    })
     
-    # False positive patterns
-    IGNORE_PATTERNS = [
-        r".*\.png$",
-        r".*\.jpg$",
-        r".*\.gif$",
-        r".*\.svg$",
-        r".*\.css$",
-        r".*\.js$",
-    ]
+    # False positive file extensions (asset names like logo@2x.png)
+    IGNORE_EXTENSIONS = (".png", ".jpg", ".gif", ".svg", ".css", ".js")
     
     def extract(self, content: str) -> list[str]:
         """
@@ -55,39 +55,59 @@ class EmailExtractor:
             content: HTML or text content
         
         Returns:
-            List of unique, valid email addresses
+            List of unique, valid email addresses in page order
         """
-        # Find all email-like strings
-        matches = self.EMAIL_PATTERN.findall(content)
+        # Find all email-like strings (Hyperscan narrows the regex pass)
+        regions = self.SCANNER.scan(content)
+        return self.extract_regions([content] if regions is None else regions[0])
+    
+    def extract_regions(self, regions: list[str]) -> list[str]:
+        """
+        Extract email addresses from pre-scanned regions.
+        
+        Args:
+            regions: Text regions that may contain emails (or the whole content)
         
-        # Filter and deduplicate
-        emails = set()
-        for email in matches:
-            email = email.lower().strip()
-            
-            if self._is_valid(email):
-                emails.add(email)
+        Returns:
+            List of unique, valid email addresses in page order
+        """
+        # Stream matches - validate each distinct address only once
+        # (dict keeps first-seen page order, so no sort is needed)
+        emails = {}
+        seen = set()
+        for region in regions:
+            for match in self.EMAIL_MATCHER.finditer(region):
+                email = match.group().lower()
+                if email in seen:
+                    continue
+                seen.add(email)
+                
+                if self._is_valid(email):
+                    emails[email] = None
         
-        return sorted(list(emails))
+        return list(emails)
     
     def _is_valid(self, email: str) -> bool:
-        """Validate an email address"""
-        # Check domain
-        domain = email.split("@")[1] if "@" in email else ""
+        """Validate an email address (emails arrive lowercased)"""
+        # Basic validation - cheapest checks first
+        if len(email) < 5 or len(email) > 254:
+            return False
         
-        if domain in self.IGNORE_DOMAINS:
+        if ".." in email:
             return False
         
-        # Check patterns
-        for pattern in self.IGNORE_PATTERNS:
-            if re.match(pattern, email):
-                return False
+        # Check file extensions
+        if email.endswith(self.IGNORE_EXTENSIONS):
+            return False
         
-        # Basic validation
-        if len(email) < 5 or len(email) > 254:
+        local, _, domain = email.partition("@")
+        
+        # Local part can't start or end with a dot
+        if local.startswith(".") or local.endswith("."):
             return False
         
-        if ".." in email:
+        # Check domain
+        if domain in self.IGNORE_DOMAINS:
             return False
         
         return True
@@ -5,10 +5,10 @@ Uses Groq (fast, free) or Ollama (local) for intelligent extraction.
 """
 
 import json
-import re
 from typing import Optional
-import httpx
 from src.config import config
+from src.utils.fast_json import loads
+from src.optimization.connection_pool import ConnectionPoolManager
 
 
 class LLMExtractor:
@@ -20,8 +20,11 @@ class LLMExtractor:
     - Ollama (local, unlimited)
     """
     
-    def __init__(self):
-        self.client = httpx.AsyncClient(timeout=60.0)
+    # LLM calls can take far longer than the shared pool's default timeout
+    TIMEOUT = 60.0
+    
+    # Upper bound on Groq completion tokens for batched extraction
+    MAX_BATCH_TOKENS = 8000
     
     async def extract(
         self, 
@@ -52,11 +55,54 @@ class LLMExtractor:
         else:
             return await self._extract_ollama(prompt)
     
-    async def _extract_groq(self, prompt: str) -> dict:
+    async def extract_batch(
+        self,
+        htmls: list[str],
+        fields: list[str],
+        max_html_length: int = 20000
+    ) -> list[dict]:
+        """
+        Extract structured data from several pages in one LLM request.
+        
+        Args:
+            htmls: Raw HTML content per site
+            fields: Fields to extract for every site
+            max_html_length: Total HTML characters to send (split evenly)
+        
+        Returns:
+            One dict of extracted fields per site ({} where nothing came back)
+        """
+        if not htmls:
+            return []
+        
+        per_site = max_html_length // len(htmls)
+        prompt = self._build_batch_prompt([html[:per_site] for html in htmls], fields)
+        
+        if config.llm.use_groq:
+            # Output grows with the number of sites
+            result = await self._extract_groq(
+                prompt,
+                max_tokens=min(self.MAX_BATCH_TOKENS, 1000 * len(htmls))
+            )
+        else:
+            result = await self._extract_ollama(prompt)
+        
+        items = result.get("results", [])
+        if not isinstance(items, list):
+            items = []
+        
+        return [
+            items[i] if i < len(items) and isinstance(items[i], dict) else {}
+            for i in range(len(htmls))
+        ]
+    
+    async def _extract_groq(self, prompt: str, max_tokens: int = 1000) -> dict:
         """Extract using Groq API"""
         try:
-            response = await self.client.post(
+            client = await ConnectionPoolManager.get_client()
+            response = await client.post(
                 "https://api.groq.com/openai/v1/chat/completions",
+                timeout=self.TIMEOUT,
                 headers={
                     "Authorization": f"Bearer {config.llm.groq_api_key}",
                     "Content-Type": "application/json"
@@ -68,12 +114,12 @@ class LLMExtractor:
                         {"role": "user", "content": prompt}
                     ],
                     "temperature": 0.1,
-                    "max_tokens": 1000
+                    "max_tokens": max_tokens
                 }
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = loads(response.content)
                 content = data["choices"][0]["message"]["content"]
                 return self._parse_json(content)
             else:
@@ -86,8 +132,10 @@ class LLMExtractor:
     async def _extract_ollama(self, prompt: str) -> dict:
         """Extract using Ollama (local)"""
         try:
-            response = await self.client.post(
+            client = await ConnectionPoolManager.get_client()
+            response = await client.post(
                 f"{config.llm.ollama_host}/api/generate",
+                timeout=self.TIMEOUT,
                 json={
                     "model": config.llm.ollama_model,
                     "prompt": prompt,
@@ -97,7 +145,7 @@ class LLMExtractor:
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = loads(response.content)
                 return self._parse_json(data.get("response", ""))
             return {}
         except Exception as e:
@@ -126,23 +174,53 @@ Example output:
     "phone": null
 }}
 
+Your JSON:"""
+
+    def _build_batch_prompt(self, htmls: list[str], fields: list[str]) -> str:
+        """Build one extraction prompt covering several sites"""
+        fields_str = ", ".join(fields)
+        sites = "\n\n".join(
+            f"SITE {i+1}:\n{html}" for i, html in enumerate(htmls)
+        )
+        
+        return f"""Extract the following fields from each of these {len(htmls)} HTML pages:
+FIELDS: {fields_str}
+
+{sites}
+
+INSTRUCTIONS:
+1. Only extract data that is CLEARLY present in that site's HTML
+2. Use null for missing fields
+3. Return ONLY a valid JSON object with one entry per site, in order
+
+Example output:
+{{"results": [
+    {{"company_name": "Example Corp", "email": "contact@example.com", "phone": null}},
+    {{"company_name": null, "email": null, "phone": "+1 555 123 4567"}}
+]}}
+
 Your JSON:"""
 
     def _parse_json(self, text: str) -> dict:
         """Safely parse JSON from LLM response"""
         try:
             # Try direct parse
-            return json.loads(text)
+            return loads(text)
         except:
             pass
         
-        # Try to find JSON in response
-        json_match = re.search(r'\{[^{}]*\}', text, re.DOTALL)
-        if json_match:
+        # Find the first complete JSON object embedded in prose.
+        # raw_decode tracks nesting and braces inside strings for us.
+        decoder = json.JSONDecoder()
+        start = text.find("{")
+        while start != -1:
             try:
-                return json.loads(json_match.group())
-            except:
+                data, _ = decoder.raw_decode(text, start)
+                if isinstance(data, dict):
+                    return data
+            except ValueError:
                 pass
+            start = text.find("{", start + 1)
         
         return {}
     
@@ -195,8 +273,7 @@ Only the JSON, no explanation:"""
         return sorted(sites, key=lambda x: x.get("relevance_score", 0), reverse=True)
     
     async def close(self):
-        """Close HTTP client"""
-        await self.client.aclose()
+        """Nothing to close - requests use the shared ConnectionPoolManager client"""
 
 
 # Convenience function
@@ -5,14 +5,21 @@ Extracts and downloads media files from web pages.
 """
 
 import os
-import re
 import asyncio
 import hashlib
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 from typing import Optional
-import httpx
+from selectolax.lexbor import LexborHTMLParser
 from src.config import config
+from src.optimization.connection_pool import ConnectionPoolManager
+
+try:
+    from xxhash import xxh3_64_hexdigest
+except ImportError:
+    xxh3_64_hexdigest = None
 
 
 class MediaExtractor:
@@ -31,25 +38,22 @@ class MediaExtractor:
     DOCUMENT_EXTENSIONS = {".pdf", ".doc", ".docx"}
     AUDIO_EXTENSIONS = {".mp3", ".wav", ".ogg"}
     
-    IMAGE_PATTERN = re.compile(
-        r'<img[^>]+src=["\']([^"\']+)["\']',
-        re.IGNORECASE
+    # URL fragments of tracking pixels and tiny spacer images
+    SKIP_IMAGE_PATTERNS = (
+        "pixel", "tracking", "beacon", "analytics",
+        "1x1", "spacer", "blank", "clear.gif"
     )
     
-    SRCSET_PATTERN = re.compile(
-        r'<img[^>]+srcset=["\']([^"\']+)["\']',
-        re.IGNORECASE
-    )
+    # Bytes read per chunk when streaming downloads to disk
+    DOWNLOAD_CHUNK_SIZE = 65536
     
-    VIDEO_PATTERN = re.compile(
-        r'<(?:video|source)[^>]+src=["\']([^"\']+)["\']',
-        re.IGNORECASE
-    )
+    # Attributes holding image URLs (lazy-loading libraries use data-*)
+    IMAGE_SRC_ATTRIBUTES = ("src", "data-src", "data-lazy-src", "data-original")
+    IMAGE_SRCSET_ATTRIBUTES = ("srcset", "data-srcset")
     
     def __init__(self, download_dir: Optional[Path] = None):
         self.download_dir = download_dir or config.downloads_dir
         self.download_dir.mkdir(exist_ok=True)
-        self.client = httpx.AsyncClient(timeout=30.0)
     
     def extract_image_urls(self, html: str, base_url: str) -> list[str]:
         """
@@ -62,33 +66,11 @@ class MediaExtractor:
         Returns:
             List of absolute image URLs
         """
-        urls = set()
-        
-        # Extract from src
-        for match in self.IMAGE_PATTERN.findall(html):
-            url = self._normalize_url(match, base_url)
-            if url:
-                urls.add(url)
-        
-        # Extract from srcset (get highest resolution)
-        for match in self.SRCSET_PATTERN.findall(html):
-            srcset_urls = self._parse_srcset(match, base_url)
-            if srcset_urls:
-                urls.add(srcset_urls[-1])  # Highest resolution
-        
-        # Filter out data URLs and tracking pixels
-        return [u for u in urls if self._is_valid_image_url(u)]
+        return self._tree_images(LexborHTMLParser(html), base_url)
     
     def extract_video_urls(self, html: str, base_url: str) -> list[str]:
         """Extract all video URLs from HTML"""
-        urls = set()
-        
-        for match in self.VIDEO_PATTERN.findall(html):
-            url = self._normalize_url(match, base_url)
-            if url and self._get_extension(url) in self.VIDEO_EXTENSIONS:
-                urls.add(url)
-        
-        return list(urls)
+        return self._tree_videos(LexborHTMLParser(html), base_url)
     
     def extract_all_media(self, html: str, base_url: str) -> dict:
         """
@@ -97,11 +79,47 @@ class MediaExtractor:
         Returns:
             Dict with images, videos, documents lists
         """
+        # Parse once and read both tag types from the tree
+        tree = LexborHTMLParser(html)
         return {
-            "images": self.extract_image_urls(html, base_url),
-            "videos": self.extract_video_urls(html, base_url)
+            "images": self._tree_images(tree, base_url),
+            "videos": self._tree_videos(tree, base_url)
         }
     
+    def _tree_images(self, tree, base_url: str) -> list[str]:
+        """Collect image URLs from <img> nodes, including lazy-load attributes"""
+        urls = set()
+        
+        for node in tree.css("img"):
+            attributes = node.attributes
+            
+            for name in self.IMAGE_SRC_ATTRIBUTES:
+                url = self._normalize_url(attributes.get(name), base_url)
+                if url:
+                    urls.add(url)
+            
+            # Get highest resolution from srcset
+            for name in self.IMAGE_SRCSET_ATTRIBUTES:
+                srcset = attributes.get(name)
+                if srcset:
+                    candidates = self._parse_srcset(srcset, base_url)
+                    if candidates:
+                        urls.add(max(candidates, key=itemgetter(1))[0])
+        
+        # Filter out data URLs and tracking pixels
+        return [u for u in urls if self._is_valid_image_url(u)]
+    
+    def _tree_videos(self, tree, base_url: str) -> list[str]:
+        """Collect video URLs from <video>/<source> nodes"""
+        urls = set()
+        
+        for node in tree.css("video, source"):
+            url = self._normalize_url(node.attributes.get("src"), base_url)
+            if url and self._get_extension(url) in self.VIDEO_EXTENSIONS:
+                urls.add(url)
+        
+        return list(urls)
+    
     async def download_image(
         self, 
         url: str,
@@ -117,29 +135,37 @@ class MediaExtractor:
         Returns:
             Path to downloaded file or None
         """
+        filepath = None
+        
         try:
-            response = await self.client.get(
+            client = await ConnectionPoolManager.get_client()
+            async with client.stream(
+                "GET",
                 url,
                 headers={"User-Agent": "Mozilla/5.0"}
-            )
-            
-            if response.status_code != 200:
-                return None
-            
-            # Generate filename
-            if not filename:
-                ext = self._get_extension(url) or ".jpg"
-                hash_name = hashlib.md5(url.encode()).hexdigest()[:12]
-                filename = f"{hash_name}{ext}"
-            
-            # Save file
-            filepath = self.download_dir / filename
-            filepath.write_bytes(response.content)
+            ) as response:
+                if response.status_code != 200:
+                    return None
+                
+                # Generate filename
+                if not filename:
+                    ext = self._get_extension(url) or ".jpg"
+                    hash_name = self._url_hash(url)
+                    filename = f"{hash_name}{ext}"
+                
+                # Save file chunk by chunk instead of buffering the whole body
+                filepath = self.download_dir / filename
+                with open(filepath, "wb") as f:
+                    async for chunk in response.aiter_bytes(self.DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
             
             return filepath
         
         except Exception as e:
             print(f"Download failed: {url} - {e}")
+            # Don't leave a truncated file behind
+            if filepath is not None:
+                filepath.unlink(missing_ok=True)
             return None
     
     async def download_all_images(
@@ -187,37 +213,55 @@ class MediaExtractor:
         
         return url
     
-    def _parse_srcset(self, srcset: str, base_url: str) -> list[str]:
-        """Parse srcset attribute and return URLs sorted by size"""
-        parts = srcset.split(",")
-        urls = []
+    def _parse_srcset(self, srcset: str, base_url: str) -> list[tuple[str, float]]:
+        """
+        Parse srcset attribute into (url, size) candidates.
         
-        for part in parts:
-            items = part.strip().split()
-            if items:
-                url = self._normalize_url(items[0], base_url)
-                if url:
-                    urls.append(url)
+        Size is the width for "640w" descriptors; density descriptors
+        ("2x", default 1x) are scaled by 100 so they order the same way.
+        """
+        candidates = []
         
-        return urls
+        for part in srcset.split(","):
+            items = part.split()
+            if not items:
+                continue
+            
+            url = self._normalize_url(items[0], base_url)
+            if url:
+                candidates.append((url, self._srcset_size(items[1] if len(items) > 1 else "1x")))
+        
+        return candidates
+    
+    def _srcset_size(self, descriptor: str) -> float:
+        """Comparable size for a srcset descriptor (0 if unparseable)"""
+        try:
+            if descriptor.endswith("w"):
+                return float(descriptor[:-1])
+            if descriptor.endswith("x"):
+                return float(descriptor[:-1]) * 100
+        except ValueError:
+            pass
+        return 0.0
     
-    def _get_extension(self, url: str) -> Optional[str]:
-        """Get file extension from URL"""
+    def _url_hash(self, url: str) -> str:
+        """Stable 12-char filename hash for a URL (not cryptographic)"""
+        if xxh3_64_hexdigest:
+            return xxh3_64_hexdigest(url.encode())[:12]
+        return hashlib.md5(url.encode()).hexdigest()[:12]
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _get_extension(url: str) -> Optional[str]:
+        """Get file extension from URL (cached - pages repeat CDN URLs)"""
         path = urlparse(url).path
         ext = os.path.splitext(path)[1].lower()
         return ext if ext else None
     
     def _is_valid_image_url(self, url: str) -> bool:
         """Check if URL is a valid image"""
-        # Skip tracking pixels and tiny images
-        skip_patterns = [
-            "pixel", "tracking", "beacon", "analytics",
-            "1x1", "spacer", "blank", "clear.gif"
-        ]
-        
         url_lower = url.lower()
-        return not any(p in url_lower for p in skip_patterns)
+        return not any(p in url_lower for p in self.SKIP_IMAGE_PATTERNS)
     
     async def close(self):
-        """Close HTTP client"""
-        await self.client.aclose()
+        """Nothing to close - downloads use the shared ConnectionPoolManager client"""
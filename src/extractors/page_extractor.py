@@ -0,0 +1,53 @@
+"""
+Page Extractor - Emails and Social Links in One Pass
+
+Runs the email and social media patterns through a single Hyperscan
+database when a page needs both.
+"""
+
+from src.extractors.email_extractor import EmailExtractor
+from src.extractors.social_extractor import SocialExtractor
+from src.extractors.pattern_scanner import PatternScanner
+
+
+class PageExtractor:
+    """
+    Extract emails and social links from the same HTML.
+    
+    One Hyperscan pass flags the regions for the email pattern and every
+    social platform; each extractor then runs its `re` patterns over its
+    own regions only. Without hyperscan the two extractors scan the
+    content separately.
+    """
+    
+    # Group 0 is the email pattern, then one group per social platform
+    SCANNER = PatternScanner([
+        [EmailExtractor.EMAIL_PATTERN],
+        *([p] for p in SocialExtractor.PATTERNS.values())
+    ])
+    
+    def __init__(self):
+        self.email_extractor = EmailExtractor()
+        self.social_extractor = SocialExtractor()
+    
+    def extract(self, content: str) -> tuple[list[str], dict[str, list[str]]]:
+        """
+        Extract emails and social links from content.
+        
+        Args:
+            content: HTML content
+        
+        Returns:
+            (emails, social) - as EmailExtractor.extract and SocialExtractor.extract
+        """
+        scanned = self.SCANNER.scan(content)
+        if scanned is None:
+            return (
+                self.email_extractor.extract(content),
+                self.social_extractor.extract(content)
+            )
+        
+        return (
+            self.email_extractor.extract_regions(scanned[0]),
+            self.social_extractor.extract_scanned(content, scanned[1:])
+        )
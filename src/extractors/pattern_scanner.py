@@ -0,0 +1,179 @@
+"""
+Pattern Scanner - Multi-Pattern Hyperscan Matching
+
+Matches groups of regexes in a single DFA pass over the content.
+"""
+
+import re
+from typing import Optional
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+
+# Non-ASCII characters `re.IGNORECASE` matches against ASCII letters
+# (İ ı ſ K) - neither Hyperscan's caseless mode nor RE2's (?i) folds
+# them the same way
+ASCII_FOLD_PATTERN = re.compile("[\u0130\u0131\u017f\u212a]")
+
+# Shorthand classes and boundaries RE2 treats as ASCII-only, unlike `re`
+UNICODE_CLASS_PATTERN = re.compile(r"\\[wWdDsSbB]")
+
+
+class LinearTimePattern:
+    """
+    RE2 twin of a stdlib pattern, used wherever the two agree.
+    
+    Caseless text holding ASCII_FOLD_PATTERN characters goes to the
+    stdlib pattern instead, so results never depend on the engine.
+    """
+    
+    def __init__(self, pattern: re.Pattern, compiled):
+        self.pattern = pattern
+        self._compiled = compiled
+        self._caseless = bool(pattern.flags & re.IGNORECASE)
+    
+    def _engine(self, text: str):
+        """RE2 unless `re`'s case folding could match differently"""
+        if self._caseless and not text.isascii() and ASCII_FOLD_PATTERN.search(text):
+            return self.pattern
+        return self._compiled
+    
+    def finditer(self, text: str):
+        return self._engine(text).finditer(text)
+    
+    def findall(self, text: str) -> list:
+        return self._engine(text).findall(text)
+
+
+def linear_time(pattern: re.Pattern):
+    """
+    RE2 equivalent of a compiled `re` pattern, or the pattern itself.
+    
+    RE2 matches in linear time with no backtracking, so hostile or very
+    large pages can't blow up a full-text scan. The stdlib pattern stays
+    the source of truth (Hyperscan compiles from it); re2 is optional.
+    Patterns using \\w, \\d, \\s or \\b keep the stdlib engine, since
+    RE2 gives those ASCII-only meanings.
+    """
+    if re2 is None or UNICODE_CLASS_PATTERN.search(pattern.pattern):
+        return pattern
+    
+    try:
+        compiled = re2.compile(("(?i)" if pattern.flags & re.IGNORECASE else "") + pattern.pattern)
+    except Exception:
+        # Syntax RE2 doesn't support - keep the backtracking engine
+        return pattern
+    return LinearTimePattern(pattern, compiled)
+
+
+class PatternScanner:
+    """
+    Prefilter text for several pattern groups in one Hyperscan pass.
+    
+    Each group is a list of compiled `re` patterns. scan() returns, per
+    group, the regions of the text where any of its patterns match. Every
+    `re` match lies inside one region, so running the group's regexes over
+    the regions gives exactly the matches a full-text scan would, while the
+    `re` engine only touches a small fraction of the content.
+    
+    ASCII text is scanned with a byte-level database. Non-ASCII text needs
+    `re`'s Unicode semantics for \\w, \\d, \\s and case folding, so it is
+    scanned with a UTF8/UCP database instead - or, when the patterns are
+    too large to compile that way, left to the full `re` scan. So is text
+    with the few non-ASCII letters `re.IGNORECASE` folds onto ASCII ones.
+    
+    Hyperscan is optional - without it scan() returns None and callers
+    scan the full text with `re`.
+    """
+    
+    def __init__(self, groups: list[list[re.Pattern]]):
+        self.groups = groups
+        self._caseless = any(p.flags & re.IGNORECASE for members in groups for p in members)
+        # Compiled databases keyed by "unicode" (compiled lazily)
+        self._dbs = {}
+    
+    def scan(self, text: str) -> Optional[list[list[str]]]:
+        """
+        Find match regions for every group in one pass.
+        
+        Returns:
+            Region strings per group (in order), or None if the text has to
+            be scanned with `re` (hyperscan unavailable or unsupported)
+        """
+        unicode = not text.isascii()
+        if unicode and self._caseless and ASCII_FOLD_PATTERN.search(text):
+            return None
+        
+        db = self._get_db(unicode)
+        if db is None:
+            return None
+        
+        try:
+            data = text.encode("utf-8")
+        except UnicodeEncodeError:
+            # Lone surrogates - not valid UTF-8 for Hyperscan
+            return None
+        
+        spans = [[] for _ in self.groups]
+        
+        def on_match(group, start, end, flags, context):
+            spans[group].append((start, end))
+        
+        db.scan(data, match_event_handler=on_match)
+        
+        return [
+            [data[start:end].decode("utf-8", "ignore") for start, end in self._merge(found)]
+            for found in spans
+        ]
+    
+    def _get_db(self, unicode: bool):
+        """Get the ASCII or Unicode database, compiling it on first use"""
+        if unicode not in self._dbs:
+            self._dbs[unicode] = self._compile(unicode)
+        return self._dbs[unicode]
+    
+    def _compile(self, unicode: bool):
+        """Compile all groups into one Hyperscan database (None on failure)"""
+        try:
+            import hyperscan
+            
+            patterns = [
+                (pattern, group)
+                for group, members in enumerate(self.groups)
+                for pattern in members
+            ]
+            
+            base = hyperscan.HS_FLAG_SOM_LEFTMOST
+            if unicode:
+                base |= hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+            
+            db = hyperscan.Database()
+            db.compile(
+                expressions=[p.pattern.encode() for p, _ in patterns],
+                ids=[group for _, group in patterns],
+                flags=[
+                    base | (hyperscan.HS_FLAG_CASELESS if p.flags & re.IGNORECASE else 0)
+                    for p, _ in patterns
+                ]
+            )
+            return db
+        except Exception:
+            # hyperscan not installed, or a pattern unsupported / too large
+            return None
+    
+    @staticmethod
+    def _merge(spans: list[tuple[int, int]]) -> list[tuple[int, int]]:
+        """Merge Hyperscan's overlapping match reports into disjoint regions"""
+        regions = []
+        
+        for start, end in sorted(spans):
+            if regions and start <= regions[-1][1]:
+                if end > regions[-1][1]:
+                    regions[-1][1] = end
+            else:
+                regions.append([start, end])
+        
+        return [(start, end) for start, end in regions]
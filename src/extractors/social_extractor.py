@@ -7,6 +7,7 @@ Extracts social media profile URLs from HTML content.
 import re
 from typing import Optional
 from urllib.parse import urlparse
+from src.extractors.pattern_scanner import PatternScanner, linear_time
 
 
 class SocialExtractor:
@@ -33,11 +34,29 @@ class SocialExtractor:
         "pinterest": re.compile(r'https?://(www\.)?pinterest\.com/([a-zA-Z0-9_]+)/?', re.I),
     }
     
-    IGNORE_USERNAMES = {
-        "share", "sharer", "intent", "home", "login", "signup",
-        "help", "about", "contact", "privacy", "terms", "policies"
+    # Linear-time matchers for PATTERNS (RE2 when installed)
+    MATCHERS = {platform: linear_time(p) for platform, p in PATTERNS.items()}
+    
+    # Hyperscan prefilter for every platform in one pass (compiled lazily)
+    SCANNER = PatternScanner([[p] for p in PATTERNS.values()])
+    
+    # Canonical profile URL builders
+    URL_TEMPLATES = {
+        "twitter": "https://twitter.com/{}".format,
+        "instagram": "https://instagram.com/{}".format,
+        "facebook": "https://facebook.com/{}".format,
+        "linkedin": "https://linkedin.com/in/{}".format,
+        "tiktok": "https://tiktok.com/@{}".format,
+        "youtube": "https://youtube.com/{}".format,
+        "pinterest": "https://pinterest.com/{}".format,
     }
     
+    IGNORE_USERNAMES = frozenset({
+        "share", "sharer", "intent", "home", "login", "signup",
+        "help", "about", "contact", "privacy", "terms", "policies",
+        "explore", "i"
+    })
+    
     def extract(self, content: str) -> dict[str, list[str]]:
         """
         Extract social media links from content.
@@ -45,13 +64,36 @@ class SocialExtractor:
         Args:
             content: HTML content
         
+        Returns:
+            Dict mapping platform to list of profile URLs
+        """
+        return self.extract_scanned(content, self.SCANNER.scan(content))
+    
+    def extract_scanned(
+        self,
+        content: str,
+        scanned: Optional[list[list[str]]]
+    ) -> dict[str, list[str]]:
+        """
+        Extract social media links using pre-scanned regions.
+        
+        Args:
+            content: HTML content
+            scanned: Regions per platform (in PATTERNS order), or None to
+                scan the full content
+        
         Returns:
             Dict mapping platform to list of profile URLs
         """
         results = {}
         
-        for platform, pattern in self.PATTERNS.items():
-            matches = pattern.findall(content)
+        for i, (platform, pattern) in enumerate(self.MATCHERS.items()):
+            if scanned is None:
+                matches = pattern.findall(content)
+            else:
+                # Only the regions Hyperscan flagged need the regex pass
+                matches = [m for region in scanned[i] for m in pattern.findall(region)]
+            
             urls = set()
             
             for match in matches:
@@ -63,19 +105,11 @@ class SocialExtractor:
                     urls.add(url)
             
             if urls:
-                results[platform] = sorted(list(urls))
+                results[platform] = sorted(urls)
         
         return results
     
     def _build_url(self, platform: str, username: str) -> str:
         """Build canonical URL for platform"""
-        templates = {
-            "twitter": f"https://twitter.com/{username}",
-            "instagram": f"https://instagram.com/{username}",
-            "facebook": f"https://facebook.com/{username}",
-            "linkedin": f"https://linkedin.com/in/{username}",
-            "tiktok": f"https://tiktok.com/@{username}",
-            "youtube": f"https://youtube.com/{username}",
-            "pinterest": f"https://pinterest.com/{username}",
-        }
-        return templates.get(platform, "")
+        template = self.URL_TEMPLATES.get(platform)
+        return template(username) if template else ""
@@ -4,6 +4,7 @@ Max Speed Web Scraper - Main Entry Point
 
 import asyncio
 from typing import Optional
+from urllib.parse import urlparse
 import typer
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -14,6 +15,16 @@ from src.brain.brain_layer import BrainLayer
 from src.scrapers.engine_selector import smart_scrape
 from src.extractors.email_extractor import EmailExtractor
 from src.extractors.social_extractor import SocialExtractor
+from src.extractors.page_extractor import PageExtractor
+from src.optimization.connection_pool import DNSCache
+from src.utils.fast_json import dumps
+
+# Use uvloop's faster event loop where available (Linux/macOS)
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
 
 app = typer.Typer(
     name="scraper",
@@ -53,23 +64,34 @@ def discover(
             console.print(f"✅ Discovered [bold]{len(discovered)}[/] websites\n")
             
             if extract and discovered:
+                # Resolve every host in one concurrent wave so the scrapes
+                # below hit the system resolver cache
+                hosts = {urlparse(site["url"]).hostname for site in discovered}
+                await DNSCache().preload([h for h in hosts if h])
+                
                 # Phase 2: Extraction
                 task = progress.add_task("Extracting data...", total=len(discovered))
-                results = []
+                page_extractor = PageExtractor()
+                semaphore = asyncio.Semaphore(config.scraper.max_concurrency)
                 
-                for site in discovered:
+                async def process(site: dict) -> Optional[dict]:
                     try:
-                        html = await smart_scrape(site["url"])
-                        emails = EmailExtractor().extract(html)
-                        social = SocialExtractor().extract(html)
-                        results.append({
+                        async with semaphore:
+                            html = await smart_scrape(site["url"])
+                        emails, social = page_extractor.extract(html)
+                        return {
                             "url": site["url"],
                             "emails": emails,
                             "social": social
-                        })
+                        }
                     except Exception as e:
                         console.print(f"[yellow]⚠ Failed: {site['url']}: {e}[/]")
-                    progress.advance(task)
+                    finally:
+                        progress.advance(task)
+                
+                # Scrape sites concurrently (bounded by max_concurrency)
+                processed = await asyncio.gather(*(process(site) for site in discovered))
+                results = [r for r in processed if r is not None]
                 
                 # Display results
                 table = Table(title="📦 Extracted Data")
@@ -88,9 +110,8 @@ def discover(
                 
                 # Save if output specified
                 if output:
-                    import json
-                    with open(output, 'w') as f:
-                        json.dump(results, f, indent=2)
+                    with open(output, 'wb') as f:
+                        f.write(dumps(results, indent=True))
                     console.print(f"\n💾 Saved to [green]{output}[/]")
                 
                 return results
@@ -5,6 +5,7 @@ Manages persistent HTTP connections for maximum speed.
 """
 
 import asyncio
+from collections import deque
 from typing import Optional
 import httpx
 
@@ -22,6 +23,7 @@ class ConnectionPoolManager:
     
     _instance = None
     _client: Optional[httpx.AsyncClient] = None
+    _lock = asyncio.Lock()
     
     def __new__(cls):
         if cls._instance is None:
@@ -32,16 +34,19 @@ class ConnectionPoolManager:
     async def get_client(cls) -> httpx.AsyncClient:
         """Get or create shared HTTP client"""
         if cls._client is None:
-            cls._client = httpx.AsyncClient(
-                http2=True,
-                follow_redirects=True,
-                timeout=30.0,
-                limits=httpx.Limits(
-                    max_connections=100,
-                    max_keepalive_connections=50,
-                    keepalive_expiry=30.0
-                )
-            )
+            async with cls._lock:
+                # Re-check: another task may have created it while we waited
+                if cls._client is None:
+                    cls._client = httpx.AsyncClient(
+                        http2=True,
+                        follow_redirects=True,
+                        timeout=30.0,
+                        limits=httpx.Limits(
+                            max_connections=100,
+                            max_keepalive_connections=50,
+                            keepalive_expiry=30.0
+                        )
+                    )
         return cls._client
     
     @classmethod
@@ -77,16 +82,15 @@ class DNSCache:
             if time.time() - timestamp < self._ttl:
                 return ip
         
-        # Resolve
+        # Resolve (IPv4 or IPv6)
         try:
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                lambda: socket.gethostbyname(hostname)
-            )
+            loop = asyncio.get_running_loop()
+            infos = await loop.getaddrinfo(hostname, None, type=socket.SOCK_STREAM)
+            result = infos[0][4][0]
             self._cache[hostname] = (result, time.time())
             return result
-        except:
+        except (OSError, IndexError, UnicodeError, ValueError):
+            # Unresolvable, or not a valid (IDNA) hostname
             return None
     
     async def preload(self, hostnames: list[str]):
@@ -116,7 +120,7 @@ class RequestBatcher:
     ):
         self.batch_size = batch_size
         self.batch_delay = batch_delay
-        self._queue = []
+        self._queue = deque()
         self._results = {}
     
     async def add(self, url: str) -> str:
@@ -135,8 +139,10 @@ class RequestBatcher:
             return
         
         # Get current batch
-        batch = self._queue[:self.batch_size]
-        self._queue = self._queue[self.batch_size:]
+        batch = [
+            self._queue.popleft()
+            for _ in range(min(self.batch_size, len(self._queue)))
+        ]
         
         # Execute in parallel
         client = await ConnectionPoolManager.get_client()
@@ -6,9 +6,20 @@ Parallel scraping with process and thread pools.
 
 import asyncio
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from typing import Callable, Optional
 import multiprocessing
 
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+def _map_chunk(func: Callable, chunk: list) -> list:
+    """Apply func to each item of a chunk (module-level so it pickles)"""
+    return [func(item) for item in chunk]
+
 
 class ParallelProcessor:
     """
@@ -20,6 +31,9 @@ class ParallelProcessor:
     - Async-compatible interface
     """
     
+    # Memory budgeted per worker process when sizing the pool
+    WORKER_MEMORY = 256 * 1024 * 1024
+    
     def __init__(
         self, 
         max_processes: Optional[int] = None,
@@ -33,11 +47,25 @@ class ParallelProcessor:
     def _get_process_pool(self) -> ProcessPoolExecutor:
         """Get or create process pool"""
         if self._process_pool is None:
+            # forkserver children don't inherit the parent's event loop state
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context(
+                "forkserver" if "forkserver" in methods else None
+            )
             self._process_pool = ProcessPoolExecutor(
-                max_workers=self.max_processes
+                max_workers=self._process_workers(),
+                mp_context=context
             )
         return self._process_pool
     
+    def _process_workers(self) -> int:
+        """Worker count capped by available RAM (needs psutil)"""
+        if psutil is None:
+            return self.max_processes
+        
+        available = psutil.virtual_memory().available
+        return max(1, min(self.max_processes, available // self.WORKER_MEMORY))
+    
     def _get_thread_pool(self) -> ThreadPoolExecutor:
         """Get or create thread pool"""
         if self._thread_pool is None:
@@ -60,12 +88,13 @@ class ParallelProcessor:
         Args:
             func: Function to apply to each item
             items: List of items to process
-            chunk_size: Number of items per process
+            chunk_size: Number of items per process (func then receives
+                each chunk); if None, func is applied to each item
         
         Returns:
             List of results
         """
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         pool = self._get_process_pool()
         
         if chunk_size:
@@ -79,12 +108,15 @@ class ParallelProcessor:
             # Flatten
             return [item for sublist in results for item in sublist]
         else:
-            # Item-by-item
+            # Item-by-item - shipped to workers in batches to cut pickling/IPC
+            batch = max(1, min(64, len(items) // (self.max_processes * 4)))
+            batches = [items[i:i+batch] for i in range(0, len(items), batch)]
             futures = [
-                loop.run_in_executor(pool, func, item)
-                for item in items
+                loop.run_in_executor(pool, partial(_map_chunk, func), chunk)
+                for chunk in batches
             ]
-            return await asyncio.gather(*futures)
+            results = await asyncio.gather(*futures)
+            return [item for sublist in results for item in sublist]
     
     async def map_threads(
         self, 
@@ -103,7 +135,7 @@ class ParallelProcessor:
         Returns:
             List of results
         """
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         pool = self._get_thread_pool()
         
         futures = [
@@ -128,14 +160,20 @@ class ParallelProcessor:
         Returns:
             List of results
         """
-        semaphore = asyncio.Semaphore(limit)
+        # `limit` long-lived workers pull from a shared iterator, so only
+        # O(limit) tasks exist however many coroutines are queued
+        results = [None] * len(coros)
+        pending = enumerate(coros)
         
-        async def limited(coro):
-            async with semaphore:
-                return await coro
+        async def worker():
+            for i, coro in pending:
+                try:
+                    results[i] = await coro
+                except Exception as e:
+                    results[i] = e
         
-        limited_coros = [limited(c) for c in coros]
-        return await asyncio.gather(*limited_coros, return_exceptions=True)
+        await asyncio.gather(*(worker() for _ in range(min(limit, len(coros)))))
+        return results
     
     def close(self):
         """Shutdown pools"""
@@ -161,15 +199,16 @@ async def scrape_urls_parallel(
     Returns:
         List of {url: str, content: str, error: str?}
     """
-    semaphore = asyncio.Semaphore(max_concurrent)
+    results = [None] * len(urls)
+    pending = enumerate(urls)
     
-    async def fetch(url):
-        async with semaphore:
+    async def worker():
+        for i, url in pending:
             try:
                 content = await scrape_func(url)
-                return {"url": url, "content": content}
+                results[i] = {"url": url, "content": content}
             except Exception as e:
-                return {"url": url, "error": str(e)}
+                results[i] = {"url": url, "error": str(e)}
     
-    tasks = [fetch(url) for url in urls]
-    return await asyncio.gather(*tasks)
+    await asyncio.gather(*(worker() for _ in range(min(max_concurrent, len(urls)))))
+    return results
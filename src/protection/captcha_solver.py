@@ -5,9 +5,11 @@ Automatically solves reCAPTCHA, hCaptcha, and other CAPTCHAs.
 """
 
 import asyncio
+import random
 import httpx
 from typing import Optional
 from src.config import config
+from src.utils.fast_json import loads
 
 
 class CaptchaSolver:
@@ -26,7 +28,11 @@ class CaptchaSolver:
     
     def __init__(self):
         self.api_key = config.captcha.twocaptcha_api_key
-        self.client = httpx.AsyncClient(timeout=120.0)
+        # Keep the connection alive between submit and result polls
+        self.client = httpx.AsyncClient(
+            timeout=120.0,
+            limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=15.0)
+        )
     
     def is_configured(self) -> bool:
         """Check if 2Captcha is configured"""
@@ -52,27 +58,15 @@ class CaptchaSolver:
         if not self.is_configured():
             return None
         
-        # Submit task
-        response = await self.client.post(
-            f"{self.API_URL}/in.php",
-            data={
-                "key": self.api_key,
-                "method": "userrecaptcha",
-                "googlekey": sitekey,
-                "pageurl": page_url,
-                "invisible": 1 if invisible else 0,
-                "json": 1
-            }
-        )
-        
-        data = response.json()
-        if data.get("status") != 1:
-            print(f"2Captcha submission error: {data}")
+        task_id = await self._submit({
+            "method": "userrecaptcha",
+            "googlekey": sitekey,
+            "pageurl": page_url,
+            "invisible": 1 if invisible else 0
+        })
+        if task_id is None:
             return None
         
-        task_id = data.get("request")
-        
-        # Poll for result
         return await self._poll_result(task_id)
     
     async def solve_recaptcha_v3(
@@ -97,25 +91,18 @@ class CaptchaSolver:
         if not self.is_configured():
             return None
         
-        response = await self.client.post(
-            f"{self.API_URL}/in.php",
-            data={
-                "key": self.api_key,
-                "method": "userrecaptcha",
-                "version": "v3",
-                "googlekey": sitekey,
-                "pageurl": page_url,
-                "action": action,
-                "min_score": min_score,
-                "json": 1
-            }
-        )
-        
-        data = response.json()
-        if data.get("status") != 1:
+        task_id = await self._submit({
+            "method": "userrecaptcha",
+            "version": "v3",
+            "googlekey": sitekey,
+            "pageurl": page_url,
+            "action": action,
+            "min_score": min_score
+        })
+        if task_id is None:
             return None
         
-        return await self._poll_result(data.get("request"))
+        return await self._poll_result(task_id)
     
     async def solve_hcaptcha(
         self, 
@@ -135,22 +122,15 @@ class CaptchaSolver:
         if not self.is_configured():
             return None
         
-        response = await self.client.post(
-            f"{self.API_URL}/in.php",
-            data={
-                "key": self.api_key,
-                "method": "hcaptcha",
-                "sitekey": sitekey,
-                "pageurl": page_url,
-                "json": 1
-            }
-        )
-        
-        data = response.json()
-        if data.get("status") != 1:
+        task_id = await self._submit({
+            "method": "hcaptcha",
+            "sitekey": sitekey,
+            "pageurl": page_url
+        })
+        if task_id is None:
             return None
         
-        return await self._poll_result(data.get("request"))
+        return await self._poll_result(task_id)
     
     async def solve_turnstile(
         self, 
@@ -170,32 +150,74 @@ class CaptchaSolver:
         if not self.is_configured():
             return None
         
+        task_id = await self._submit({
+            "method": "turnstile",
+            "sitekey": sitekey,
+            "pageurl": page_url
+        })
+        if task_id is None:
+            return None
+        
+        return await self._poll_result(task_id)
+    
+    async def solve_many(self, tasks: list[dict]) -> list[Optional[str]]:
+        """
+        Solve several CAPTCHAs at once.
+        
+        Tasks are submitted concurrently, then every pending task is
+        polled with a single `ids=` request per interval.
+        
+        Args:
+            tasks: in.php parameters per CAPTCHA (method, sitekey, pageurl, ...)
+        
+        Returns:
+            One token (or None) per task, in order
+        """
+        if not self.is_configured() or not tasks:
+            return [None] * len(tasks)
+        
+        task_ids = await asyncio.gather(*(self._submit(task) for task in tasks))
+        
+        pending = [task_id for task_id in task_ids if task_id is not None]
+        solved = await self._poll_many(pending) if pending else {}
+        
+        return [solved.get(task_id) for task_id in task_ids]
+    
+    async def _submit(self, task: dict) -> Optional[str]:
+        """Submit a task to in.php, returning its id"""
         response = await self.client.post(
             f"{self.API_URL}/in.php",
-            data={
-                "key": self.api_key,
-                "method": "turnstile",
-                "sitekey": sitekey,
-                "pageurl": page_url,
-                "json": 1
-            }
+            data={"key": self.api_key, **task, "json": 1}
         )
         
-        data = response.json()
+        data = loads(response.content)
         if data.get("status") != 1:
+            print(f"2Captcha submission error: {data}")
             return None
         
-        return await self._poll_result(data.get("request"))
+        return data.get("request")
     
     async def _poll_result(
         self, 
         task_id: str,
-        max_attempts: int = 60,
-        interval: float = 3.0
+        max_attempts: int = 120,
+        interval: float = 1.5,
+        first_delay: float = 5.0
     ) -> Optional[str]:
-        """Poll for CAPTCHA solution"""
-        for _ in range(max_attempts):
-            await asyncio.sleep(interval)
+        """
+        Poll for CAPTCHA solution.
+        
+        Solves almost never finish within `first_delay`, so the first poll
+        waits that long; after that polls are `interval` apart with +/-20%
+        jitter, bounded overall by `max_attempts` intervals.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + first_delay + max_attempts * interval
+        delay = first_delay
+        
+        while loop.time() + delay <= deadline:
+            await asyncio.sleep(delay)
+            delay = interval * random.uniform(0.8, 1.2)
             
             response = await self.client.get(
                 f"{self.API_URL}/res.php",
@@ -207,7 +229,7 @@ class CaptchaSolver:
                 }
             )
             
-            data = response.json()
+            data = loads(response.content)
             
             if data.get("status") == 1:
                 return data.get("request")
@@ -218,6 +240,53 @@ class CaptchaSolver:
         
         return None
     
+    async def _poll_many(
+        self,
+        task_ids: list[str],
+        max_attempts: int = 120,
+        interval: float = 1.5,
+        first_delay: float = 5.0
+    ) -> dict[str, Optional[str]]:
+        """Poll several tasks per request (same schedule as _poll_result)"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + first_delay + max_attempts * interval
+        delay = first_delay
+        
+        results = {}
+        pending = list(task_ids)
+        
+        while pending and loop.time() + delay <= deadline:
+            await asyncio.sleep(delay)
+            delay = interval * random.uniform(0.8, 1.2)
+            
+            # Plain-text reply: one answer per id, joined by "|"
+            response = await self.client.get(
+                f"{self.API_URL}/res.php",
+                params={
+                    "key": self.api_key,
+                    "action": "get",
+                    "ids": ",".join(pending)
+                }
+            )
+            
+            answers = response.text.split("|")
+            if len(answers) != len(pending):
+                print(f"2Captcha error: {response.text}")
+                break
+            
+            still_pending = []
+            for task_id, answer in zip(pending, answers):
+                if answer == "CAPCHA_NOT_READY":
+                    still_pending.append(task_id)
+                elif answer.startswith("ERROR"):
+                    print(f"2Captcha error: {answer}")
+                    results[task_id] = None
+                else:
+                    results[task_id] = answer
+            pending = still_pending
+        
+        return results
+    
     async def get_balance(self) -> float:
         """Get account balance"""
         if not self.is_configured():
@@ -232,7 +301,7 @@ class CaptchaSolver:
             }
         )
         
-        data = response.json()
+        data = loads(response.content)
         return float(data.get("request", 0))
     
     async def close(self):
@@ -5,7 +5,18 @@ Bypasses Cloudflare protection using various techniques.
 """
 
 import asyncio
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
+from src.extractors.pattern_scanner import PatternScanner
+from src.optimization.connection_pool import ConnectionPoolManager
+from src.utils.fast_json import loads
+
+
+# Dedicated threads for blocking cloudscraper calls (JS challenge solving),
+# so they don't starve the loop's default executor
+CLOUDSCRAPER_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="cf-solve")
 
 
 class CloudflareBypass:
@@ -13,14 +24,36 @@ class CloudflareBypass:
     Cloudflare bypass using multiple strategies.
     
     Strategies (in order of attempt):
-    1. curl_cffi with TLS fingerprinting
-    2. cloudscraper
+    1. curl_cffi with TLS fingerprinting  } raced concurrently
+    2. cloudscraper                       }
     3. FlareSolverr (if running)
     4. Bright Data Web Unlocker
     """
     
+    CHALLENGE_INDICATORS = (
+        "cf-browser-verification",
+        "challenge-platform",
+        "Just a moment...",
+        "Checking your browser",
+        "cf-spinner",
+        "cf_captcha_container"
+    )
+    
+    # Characters of a response checked for challenge markers
+    CHALLENGE_SCAN_LIMIT = 16384
+    
+    # All challenge indicators in one Hyperscan pass
+    CHALLENGE_SCANNER = PatternScanner([
+        [re.compile("|".join(map(re.escape, CHALLENGE_INDICATORS)))]
+    ])
+    
     def __init__(self):
         self._flaresolverr_url = "http://localhost:8191/v1"
+        # One cloudscraper per CLOUDSCRAPER_POOL thread - its requests
+        # Session (cookies, challenge state) isn't thread-safe
+        self._local = threading.local()
+        self._scrapers = []
+        self._curl_session = None
     
     async def bypass(self, url: str) -> str:
         """
@@ -32,21 +65,29 @@ class CloudflareBypass:
         Returns:
             HTML content
         """
-        # Strategy 1: curl_cffi
+        # Strategies 1 + 2: race curl_cffi and cloudscraper (both cheap),
+        # first real page wins
+        attempts = {
+            asyncio.create_task(self._try_curl_cffi(url)): "curl_cffi",
+            asyncio.create_task(self._try_cloudscraper(url)): "cloudscraper",
+        }
         try:
-            result = await self._try_curl_cffi(url)
-            if result and not self._is_cf_challenge(result):
-                return result
-        except Exception as e:
-            print(f"curl_cffi failed: {e}")
-        
-        # Strategy 2: cloudscraper
-        try:
-            result = await self._try_cloudscraper(url)
-            if result and not self._is_cf_challenge(result):
-                return result
-        except Exception as e:
-            print(f"cloudscraper failed: {e}")
+            while attempts:
+                done, _ = await asyncio.wait(attempts, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name = attempts.pop(task)
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        print(f"{name} failed: {e}")
+                        continue
+                    if result and not self._is_cf_challenge(result):
+                        return result
+        finally:
+            # Cancelling only abandons the loser: a cloudscraper call keeps
+            # running to completion in its CLOUDSCRAPER_POOL thread
+            for task in attempts:
+                task.cancel()
         
         # Strategy 3: FlareSolverr
         try:
@@ -70,20 +111,35 @@ class CloudflareBypass:
         """Try curl_cffi with Chrome impersonation"""
         try:
             from curl_cffi.requests import AsyncSession
-            
-            async with AsyncSession(impersonate="chrome120") as session:
-                response = await session.get(url)
-                return response.text
         except ImportError:
             return None
+        
+        # One long-lived session - impersonation setup and TLS sessions reused
+        if self._curl_session is None:
+            self._curl_session = AsyncSession(impersonate="chrome120")
+        
+        response = await self._curl_session.get(url)
+        return response.text
     
     async def _try_cloudscraper(self, url: str) -> Optional[str]:
         """Try cloudscraper library"""
         try:
             import cloudscraper
+        except ImportError:
+            return None
+        
+        # Run in our own thread pool since cloudscraper is sync
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(CLOUDSCRAPER_POOL, self._cloudscraper_get, url)
+        return response.text
+    
+    def _cloudscraper_get(self, url: str):
+        """Fetch with this thread's scraper (runs in CLOUDSCRAPER_POOL)"""
+        scraper = getattr(self._local, "scraper", None)
+        if scraper is None:
+            import cloudscraper
             
-            # Run in thread pool since cloudscraper is sync
-            loop = asyncio.get_event_loop()
+            # Reused by this thread (and its keep-alive session) across calls
             scraper = cloudscraper.create_scraper(
                 browser={
                     'browser': 'chrome',
@@ -91,34 +147,30 @@ class CloudflareBypass:
                     'mobile': False
                 }
             )
-            
-            response = await loop.run_in_executor(
-                None, 
-                lambda: scraper.get(url)
-            )
-            return response.text
-        except ImportError:
-            return None
+            self._local.scraper = scraper
+            self._scrapers.append(scraper)
+        
+        return scraper.get(url)
     
     async def _try_flaresolverr(self, url: str) -> Optional[str]:
         """Try FlareSolverr API"""
         try:
-            import httpx
+            client = await ConnectionPoolManager.get_client()
+            response = await client.post(
+                self._flaresolverr_url,
+                json={
+                    "cmd": "request.get",
+                    "url": url,
+                    "maxTimeout": 60000
+                },
+                timeout=120.0
+            )
             
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                response = await client.post(
-                    self._flaresolverr_url,
-                    json={
-                        "cmd": "request.get",
-                        "url": url,
-                        "maxTimeout": 60000
-                    }
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get("status") == "ok":
-                        return data["solution"]["response"]
+            if response.status_code == 200:
+                # Rendered page + cookies - can be large
+                data = loads(response.content)
+                if data.get("status") == "ok":
+                    return data["solution"]["response"]
         except:
             pass
         
@@ -137,14 +189,21 @@ class CloudflareBypass:
         
         return None
     
+    async def close(self):
+        """Close persistent sessions"""
+        if self._curl_session:
+            await self._curl_session.close()
+            self._curl_session = None
+        for scraper in self._scrapers:
+            scraper.close()
+        self._scrapers.clear()
+        self._local = threading.local()
+    
     def _is_cf_challenge(self, html: str) -> bool:
         """Check if response is Cloudflare challenge page"""
-        indicators = [
-            "cf-browser-verification",
-            "challenge-platform",
-            "Just a moment...",
-            "Checking your browser",
-            "cf-spinner",
-            "cf_captcha_container"
-        ]
-        return any(ind in html for ind in indicators)
+        # Challenge markers sit at the top of the page
+        html = html[:self.CHALLENGE_SCAN_LIMIT]
+        regions = self.CHALLENGE_SCANNER.scan(html)
+        if regions is None:
+            return any(ind in html for ind in self.CHALLENGE_INDICATORS)
+        return bool(regions[0])
@@ -9,9 +9,13 @@ Detects the type of protection a website uses:
 - CAPTCHA
 """
 
+import asyncio
+import re
+import time
 from enum import Enum
 from typing import Optional
-import httpx
+from src.extractors.pattern_scanner import PatternScanner
+from src.optimization.connection_pool import ConnectionPoolManager
 
 
 class ProtectionType(Enum):
@@ -26,63 +30,135 @@ class ProtectionType(Enum):
     UNKNOWN = "unknown"
 
 
+# Seconds a detection result is reused
+DETECTION_TTL = 300.0
+DETECTION_CACHE_SIZE = 4096
+
+# url -> (timestamp, result) and url -> pending detection
+_detections: dict[str, tuple[float, ProtectionType]] = {}
+_in_flight: dict[str, asyncio.Task] = {}
+
+# Characters of HTML read when headers are inconclusive
+HTML_SCAN_LIMIT = 65536
+
+# HTML indicators in priority order ("access denied" etc. = generic blocking)
+HTML_INDICATORS = [
+    (ProtectionType.CLOUDFLARE, ("challenges.cloudflare.com", "cf-browser-verification")),
+    (ProtectionType.RECAPTCHA, ("recaptcha",)),  # also covers g-recaptcha
+    (ProtectionType.HCAPTCHA, ("hcaptcha", "h-captcha")),
+    (ProtectionType.PERIMETERX, ("perimeterx",)),
+    (ProtectionType.UNKNOWN, ("access denied", "bot detected", "please verify")),
+]
+
+# All indicators checked in one case-insensitive Hyperscan pass
+HTML_SCANNER = PatternScanner([
+    [re.compile("|".join(map(re.escape, indicators)), re.IGNORECASE)]
+    for _, indicators in HTML_INDICATORS
+])
+
+
 async def detect_protection(url: str) -> ProtectionType:
     """
     Detect what protection a website uses.
     
+    Results are cached for DETECTION_TTL seconds, and concurrent calls
+    for the same URL share a single request.
+    
     Args:
         url: URL to check
     
     Returns:
         ProtectionType enum
     """
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                url,
-                follow_redirects=True,
-                headers={"User-Agent": "Mozilla/5.0"}
-            )
-            
-            headers = dict(response.headers)
-            html = response.text.lower()
-            
-            # Check headers
-            if "cf-ray" in headers or "cf-cache-status" in headers:
-                return ProtectionType.CLOUDFLARE
-            
-            if "x-akamai" in str(headers).lower():
-                return ProtectionType.AKAMAI
-            
-            if "x-px" in headers or "_pxhd" in str(response.cookies):
-                return ProtectionType.PERIMETERX
-            
-            if "datadome" in str(headers).lower():
-                return ProtectionType.DATADOME
-            
-            # Check HTML content
-            if "challenges.cloudflare.com" in html or "cf-browser-verification" in html:
-                return ProtectionType.CLOUDFLARE
-            
-            if "recaptcha" in html or "g-recaptcha" in html:
-                return ProtectionType.RECAPTCHA
-            
-            if "hcaptcha" in html or "h-captcha" in html:
-                return ProtectionType.HCAPTCHA
-            
-            if "perimeterx" in html:
-                return ProtectionType.PERIMETERX
-            
-            # Check for generic blocking
-            if any(x in html for x in ["access denied", "bot detected", "please verify"]):
-                return ProtectionType.UNKNOWN
-            
-            return ProtectionType.NONE
+    cached = _detections.get(url)
+    if cached and time.monotonic() - cached[0] < DETECTION_TTL:
+        return cached[1]
+    
+    task = _in_flight.get(url)
+    if task is None:
+        task = asyncio.ensure_future(_detect(url))
+        _in_flight[url] = task
+        task.add_done_callback(lambda done: _finish_detection(url, done))
     
+    try:
+        # Shielded so one cancelled caller doesn't cancel the shared request
+        return await asyncio.shield(task)
     except Exception:
         return ProtectionType.UNKNOWN
 
 
+def _finish_detection(url: str, task: asyncio.Task):
+    """Drop a finished request from the in-flight map and cache its result"""
+    _in_flight.pop(url, None)
+    
+    if task.cancelled() or task.exception() is not None:
+        return
+    
+    _detections[url] = (time.monotonic(), task.result())
+    
+    # Evict oldest entries (dicts keep insertion order)
+    while len(_detections) > DETECTION_CACHE_SIZE:
+        del _detections[next(iter(_detections))]
+
+
+async def _detect(url: str) -> ProtectionType:
+    """Fetch a URL and classify its protection (raises on network errors)"""
+    # Shared pooled client - repeat detections skip the TCP/TLS handshake
+    client = await ConnectionPoolManager.get_client()
+    async with client.stream(
+        "GET",
+        url,
+        timeout=10.0,
+        follow_redirects=True,
+        headers={"User-Agent": "Mozilla/5.0"}
+    ) as response:
+        # httpx headers are case-insensitive with lowercased keys
+        headers = response.headers
+        
+        # Check headers - no body download needed on a hit
+        if "cf-ray" in headers or "cf-cache-status" in headers:
+            return ProtectionType.CLOUDFLARE
+        
+        if any(name.startswith("x-akamai") for name in headers):
+            return ProtectionType.AKAMAI
+        
+        if "x-px" in headers or "_pxhd" in response.cookies:
+            return ProtectionType.PERIMETERX
+        
+        if any(
+            "datadome" in name or "datadome" in value.lower()
+            for name, value in headers.multi_items()
+        ):
+            return ProtectionType.DATADOME
+        
+        # Check HTML content - markers live near the top of the page
+        html = ""
+        async for chunk in response.aiter_text():
+            html += chunk
+            if len(html) >= HTML_SCAN_LIMIT:
+                break
+        
+        return _match_html(html[:HTML_SCAN_LIMIT])
+
+
+def _match_html(html: str) -> ProtectionType:
+    """Find the highest-priority protection indicated by the HTML"""
+    regions = HTML_SCANNER.scan(html)
+    
+    if regions is None:
+        # No hyperscan - substring checks over the lowercased HTML
+        html = html.lower()
+        for protection, indicators in HTML_INDICATORS:
+            if any(x in html for x in indicators):
+                return protection
+    else:
+        for (protection, _), found in zip(HTML_INDICATORS, regions):
+            if found:
+                return protection
+    
+    return ProtectionType.NONE
+
+
 def get_recommended_engine(protection: ProtectionType) -> str:
     """
     Get recommended scraping engine for protection type.
@@ -6,7 +6,19 @@ Adds human-like behavior to avoid bot detection.
 
 import asyncio
 import random
-from typing import Optional
+from contextvars import ContextVar
+from itertools import accumulate
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+
+# Per-task RNG for stealth behaviour (see StealthBehavior.seed)
+_session_rng: ContextVar[random.Random] = ContextVar("stealth_rng", default=random.Random())
+
+
+def _rng() -> random.Random:
+    """RNG for the current task"""
+    return _session_rng.get()
 
 
 class StealthBehavior:
@@ -20,92 +32,121 @@ class StealthBehavior:
     - Click variation
     """
     
+    VIEWPORTS = (
+        (1920, 1080),
+        (1366, 768),
+        (1536, 864),
+        (1440, 900),
+        (1280, 720),
+    )
+    
+    DESKTOP_AGENTS = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15",
+    )
+    
+    # Cumulative share of DESKTOP_AGENTS (Chrome dominates real traffic)
+    DESKTOP_CUM_WEIGHTS = tuple(accumulate((0.45, 0.15, 0.10, 0.10, 0.20)))
+    
+    MOBILE_AGENTS = (
+        "Mozilla/5.0 (iPhone; CPU iPhone OS 17_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Mobile/15E148 Safari/604.1",
+        "Mozilla/5.0 (Linux; Android 14; SM-S918B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.6099.43 Mobile Safari/537.36",
+    )
+    
+    # Read-only so the shared instance can be handed out directly
+    REQUEST_HEADERS = MappingProxyType({
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Accept-Encoding": "gzip, deflate, br",
+        "DNT": "1",
+        "Connection": "keep-alive",
+        "Upgrade-Insecure-Requests": "1",
+        "Sec-Fetch-Dest": "document",
+        "Sec-Fetch-Mode": "navigate",
+        "Sec-Fetch-Site": "none",
+        "Sec-Fetch-User": "?1",
+        "Sec-CH-UA": '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
+        "Sec-CH-UA-Mobile": "?0",
+        "Sec-CH-UA-Platform": '"Windows"',
+    })
+    
+    @staticmethod
+    def seed(seed: int):
+        """
+        Make stealth randomness reproducible for the current task.
+        
+        The seeded RNG lives in a context variable, so it applies to this
+        task (and tasks it spawns) without affecting concurrent scrapers.
+        """
+        _session_rng.set(random.Random(seed))
+    
     @staticmethod
     async def random_delay(
         min_seconds: float = 0.5,
         max_seconds: float = 2.0
     ):
         """Add random delay between actions"""
-        delay = random.uniform(min_seconds, max_seconds)
+        delay = _rng().uniform(min_seconds, max_seconds)
         await asyncio.sleep(delay)
     
-    @staticmethod
-    def get_random_viewport() -> dict:
+    @classmethod
+    def get_random_viewport(cls) -> dict:
         """Get random realistic viewport size"""
-        viewports = [
-            {"width": 1920, "height": 1080},
-            {"width": 1366, "height": 768},
-            {"width": 1536, "height": 864},
-            {"width": 1440, "height": 900},
-            {"width": 1280, "height": 720},
-        ]
-        return random.choice(viewports)
+        width, height = _rng().choice(cls.VIEWPORTS)
+        return {"width": width, "height": height}
     
-    @staticmethod
-    def get_random_user_agent(device: str = "desktop") -> str:
-        """Get random user agent string"""
-        desktop_agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15",
-        ]
-        
-        mobile_agents = [
-            "Mozilla/5.0 (iPhone; CPU iPhone OS 17_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Mobile/15E148 Safari/604.1",
-            "Mozilla/5.0 (Linux; Android 14; SM-S918B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.6099.43 Mobile Safari/537.36",
-        ]
-        
+    @classmethod
+    def get_random_user_agent(cls, device: str = "desktop") -> str:
+        """Get random user agent string (desktop weighted by browser share)"""
+        rng = _rng()
         if device == "mobile":
-            return random.choice(mobile_agents)
-        return random.choice(desktop_agents)
+            return rng.choice(cls.MOBILE_AGENTS)
+        return rng.choices(cls.DESKTOP_AGENTS, cum_weights=cls.DESKTOP_CUM_WEIGHTS)[0]
     
     @staticmethod
     async def simulate_human_scroll(page, scroll_count: int = 3):
         """Simulate human-like scrolling in Playwright page"""
+        rng = _rng()
         for _ in range(scroll_count):
-            scroll_amount = random.randint(200, 500)
+            scroll_amount = rng.randint(200, 500)
             await page.mouse.wheel(0, scroll_amount)
-            await asyncio.sleep(random.uniform(0.3, 1.0))
+            await asyncio.sleep(rng.uniform(0.3, 1.0))
     
     @staticmethod
     async def simulate_mouse_movement(page, duration: float = 1.0):
         """Simulate random mouse movement in Playwright page"""
-        steps = int(duration * 10)
-        x, y = random.randint(100, 500), random.randint(100, 400)
+        rng = _rng()
+        steps = max(1, int(duration * 10))
+        x, y = rng.randint(100, 500), rng.randint(100, 400)
         
+        # Random-walk to the target, then let Playwright interpolate the
+        # intermediate moves in one call instead of one round trip per step
         for _ in range(steps):
-            x += random.randint(-50, 50)
-            y += random.randint(-30, 30)
+            x += rng.randint(-50, 50)
+            y += rng.randint(-30, 30)
             x = max(0, min(x, 1920))
             y = max(0, min(y, 1080))
-            await page.mouse.move(x, y)
-            await asyncio.sleep(0.1)
+        
+        await page.mouse.move(x, y, steps=steps)
+        await asyncio.sleep(duration)
     
-    @staticmethod
-    def get_request_headers(referer: Optional[str] = None) -> dict:
-        """Get realistic request headers"""
-        headers = {
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "DNT": "1",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "none",
-            "Sec-Fetch-User": "?1",
-            "Sec-CH-UA": '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
-            "Sec-CH-UA-Mobile": "?0",
-            "Sec-CH-UA-Platform": '"Windows"',
-        }
+    @classmethod
+    def get_request_headers(cls, referer: Optional[str] = None) -> Mapping[str, str]:
+        """
+        Get realistic request headers.
         
-        if referer:
-            headers["Referer"] = referer
-            headers["Sec-Fetch-Site"] = "cross-site"
+        Without a referer the shared read-only REQUEST_HEADERS is returned
+        (no per-request allocation); with one, a copy is adjusted.
+        """
+        if referer is None:
+            return cls.REQUEST_HEADERS
         
+        headers = dict(cls.REQUEST_HEADERS)
+        headers["Referer"] = referer
+        headers["Sec-Fetch-Site"] = "cross-site"
         return headers
     
     @staticmethod
@@ -128,26 +169,32 @@ class RateLimiter:
     ):
         self.rpm = requests_per_minute
         self.burst = burst_limit
+        self._rate = requests_per_minute / 60  # tokens per second
         self._tokens = burst_limit
-        self._last_refill = asyncio.get_event_loop().time()
+        self._last_refill = None
+        # Serializes refill/wait/take so concurrent callers can't overdraw
+        self._lock = asyncio.Lock()
     
     async def acquire(self):
         """Acquire rate limit token"""
-        now = asyncio.get_event_loop().time()
-        
-        # Refill tokens
-        elapsed = now - self._last_refill
-        refill = elapsed * (self.rpm / 60)
-        self._tokens = min(self.burst, self._tokens + refill)
-        self._last_refill = now
-        
-        # Wait if no tokens
-        if self._tokens < 1:
-            wait_time = (1 - self._tokens) / (self.rpm / 60)
-            await asyncio.sleep(wait_time)
-            self._tokens = 1
-        
-        self._tokens -= 1
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            
+            # Refill tokens
+            if self._last_refill is not None:
+                elapsed = now - self._last_refill
+                self._tokens = min(self.burst, self._tokens + elapsed * self._rate)
+            self._last_refill = now
+            
+            # Wait if no tokens
+            if self._tokens < 1:
+                wait_time = (1 - self._tokens) / self._rate
+                await asyncio.sleep(wait_time)
+                self._tokens = 1
+                self._last_refill = loop.time()
+            
+            self._tokens -= 1
     
     async def backoff(self, attempt: int):
         """Exponential backoff with jitter"""
@@ -4,7 +4,12 @@ Proxy Pool - Proxy Rotation and Management
 Manages multiple proxy sources for reliable scraping.
 """
 
+import heapq
+import logging
+import math
 import random
+import re
+import sys
 import asyncio
 from typing import Optional
 from dataclasses import dataclass, field
@@ -12,9 +17,13 @@ from datetime import datetime
 import httpx
 
 
-@dataclass
+# Child of the "scraper" logger set up in src.utils.logging
+logger = logging.getLogger("scraper.proxy")
+
+
+@dataclass(slots=True)
 class Proxy:
-    """Proxy server configuration"""
+    """Proxy server configuration (slotted - pools can hold many thousands)"""
     host: str
     port: int
     username: Optional[str] = None
@@ -24,6 +33,15 @@ class Proxy:
     last_used: Optional[datetime] = None
     fail_count: int = 0
     success_count: int = 0
+    # Cached - refreshed by update_success_rate() when the counts change
+    success_rate: float = field(init=False, default=0.5)
+    banned: bool = False
+    
+    def __post_init__(self):
+        # Share one string per country code across thousands of proxies
+        if self.country is not None:
+            self.country = sys.intern(self.country)
+        self.update_success_rate()
     
     @property
     def url(self) -> str:
@@ -33,11 +51,18 @@ class Proxy:
             auth = f"{self.username}:{self.password}@"
         return f"{self.protocol}://{auth}{self.host}:{self.port}"
     
-    @property
-    def success_rate(self) -> float:
-        """Calculate success rate"""
+    def update_success_rate(self):
+        """Recalculate success rate from the counts"""
         total = self.success_count + self.fail_count
-        return self.success_count / total if total > 0 else 0.5
+        self.success_rate = self.success_count / total if total > 0 else 0.5
+
+
+@dataclass(slots=True)
+class _Schedule:
+    """Shuffled weighted round-robin order for one candidate list"""
+    decisions: list[Proxy]
+    cursor: int = 0
+    passes: int = 0
 
 
 class ProxyPool:
@@ -51,18 +76,55 @@ class ProxyPool:
     - Country targeting
     """
     
-    def __init__(self):
+    # Failures before a proxy is banned
+    MAX_FAILURES = 5
+    
+    # Stochastic-acceptance draws before falling back to a weighted scan
+    MAX_DRAWS = 32
+    
+    # Selection strategies for get_proxy()
+    STRATEGIES = ("stochastic", "wrr")
+    
+    # Full passes over a round-robin schedule before it is rebuilt from
+    # the current success rates
+    WRR_SHUFFLE_PERIOD = 5
+    
+    def __init__(self, max_check_concurrency: int = 64, strategy: str = "stochastic"):
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown proxy selection strategy: {strategy}")
+        
+        self.max_check_concurrency = max_check_concurrency
+        self.strategy = strategy
         self._proxies: list[Proxy] = []
-        self._banned: set[str] = set()
+        self._banned_count = 0
         self._lock = asyncio.Lock()
+        # Pool-private RNG for selection
+        self._rng = random.Random()
+        # Usable proxies per (protocol, country); country None = any country
+        self._candidates: dict[tuple[str, Optional[str]], list[Proxy]] = {}
+        # (key, id(proxy)) -> index in that candidate list, for O(1) removal
+        self._positions: dict[tuple[tuple[str, Optional[str]], int], int] = {}
+        # Upper bound on the success rate of any usable proxy (may be stale
+        # high after failures - see _tighten_max_rate)
+        self._max_rate = 0.0
+        # Running total of success rates, for get_stats()
+        self._sum_rate = 0.0
+        # Round-robin schedules per candidate key ("wrr" strategy)
+        self._schedules: dict[tuple[str, Optional[str]], _Schedule] = {}
     
     def add_proxy(self, proxy: Proxy):
         """Add proxy to pool"""
         self._proxies.append(proxy)
+        self._sum_rate += proxy.success_rate
+        if proxy.banned:
+            self._banned_count += 1
+        if self._is_usable(proxy):
+            self._index(proxy)
     
     def add_proxies(self, proxies: list[Proxy]):
         """Add multiple proxies"""
-        self._proxies.extend(proxies)
+        for proxy in proxies:
+            self.add_proxy(proxy)
     
     async def get_proxy(
         self, 
@@ -72,6 +134,12 @@ class ProxyPool:
         """
         Get next available proxy.
         
+        Proxies are picked with probability proportional to their success
+        rate. The "stochastic" strategy uses roulette-wheel selection via
+        stochastic acceptance (O(1) expected). The "wrr" strategy walks a
+        shuffled weighted round-robin schedule (O(1) per pick), which stays
+        fair when a few proxies dominate the weights.
+        
         Args:
             country: Target country code (optional)
             protocol: Proxy protocol (http, socks5)
@@ -79,44 +147,192 @@ class ProxyPool:
         Returns:
             Proxy or None if pool is empty
         """
-        async with self._lock:
-            # Filter available proxies
-            available = [
-                p for p in self._proxies
-                if p.url not in self._banned
-                and p.protocol == protocol
-                and (country is None or p.country == country)
-                and p.fail_count < 5
-            ]
-            
-            if not available:
-                return None
-            
-            # Sort by success rate and pick best
-            available.sort(key=lambda p: p.success_rate, reverse=True)
-            
-            # Use weighted random (favor better proxies)
-            if len(available) > 3:
-                proxy = random.choice(available[:3])
+        # No await below, so this runs atomically on the event loop -
+        # readers don't need the lock
+        key = (protocol, country)
+        available = self._candidates.get(key)
+        if not available:
+            return None
+        
+        if self.strategy == "wrr":
+            proxy = self._next_scheduled(key, available)
+        else:
+            proxy = self._draw(available)
+        
+        proxy.last_used = datetime.now()
+        return proxy
+    
+    def _draw(self, available: list[Proxy]) -> Proxy:
+        """Pick a proxy by stochastic acceptance"""
+        rng = self._rng
+        proxy = None
+        if self._max_rate > 0:
+            # int(random() * n) is a cheaper uniform index than randrange(n)
+            rand = rng.random
+            count = len(available)
+            max_rate = self._max_rate
+            for _ in range(self.MAX_DRAWS):
+                candidate = available[int(rand() * count)]
+                if rand() * max_rate < candidate.success_rate:
+                    proxy = candidate
+                    break
+        
+        if proxy is None:
+            # Very low rates all round, or a bound left stale by failures -
+            # tighten it for later draws, then do a weighted pick over the list
+            self._tighten_max_rate()
+            weights = [p.success_rate for p in available]
+            if any(weights):
+                proxy = rng.choices(available, weights=weights)[0]
             else:
-                proxy = available[0]
-            
-            proxy.last_used = datetime.now()
-            return proxy
+                proxy = rng.choice(available)
+        
+        return proxy
+    
+    def _next_scheduled(self, key: tuple[str, Optional[str]], available: list[Proxy]) -> Proxy:
+        """Pick the next proxy from the key's weighted round-robin schedule"""
+        schedule = self._schedules.get(key)
+        if schedule is None:
+            # One slot per 0.1 of success rate, at least one per proxy
+            decisions = [
+                proxy
+                for proxy in available
+                for _ in range(max(1, int(proxy.success_rate * 10)))
+            ]
+            self._rng.shuffle(decisions)
+            schedule = self._schedules[key] = _Schedule(decisions)
+        
+        proxy = schedule.decisions[schedule.cursor]
+        schedule.cursor += 1
+        if schedule.cursor == len(schedule.decisions):
+            schedule.cursor = 0
+            schedule.passes += 1
+            if schedule.passes >= self.WRR_SHUFFLE_PERIOD:
+                # Rates have drifted - rebuild on the next pick
+                del self._schedules[key]
+        
+        return proxy
+    
+    async def sample_k(
+        self,
+        k: int,
+        country: Optional[str] = None,
+        protocol: str = "http"
+    ) -> list[Proxy]:
+        """
+        Get up to k distinct proxies, weighted by success rate.
+        
+        Efraimidis-Spirakis sampling without replacement: each proxy gets
+        the key log(u) / weight and the k largest keys win - one pass,
+        no sorting of the whole pool.
+        
+        Args:
+            k: Number of proxies wanted
+            country: Target country code (optional)
+            protocol: Proxy protocol (http, socks5)
+        
+        Returns:
+            Up to k proxies (fewer if the pool is smaller)
+        """
+        # Lock-free like get_proxy (no await below)
+        available = self._candidates.get((protocol, country))
+        if not available or k <= 0:
+            return []
+        
+        rand = self._rng.random
+        
+        def key(proxy: Proxy) -> float:
+            weight = proxy.success_rate
+            if weight <= 0:
+                return -math.inf
+            # 1 - random() is in (0, 1], so log() is always defined
+            return math.log(1.0 - rand()) / weight
+        
+        chosen = heapq.nlargest(k, available, key=key)
+        
+        now = datetime.now()
+        for proxy in chosen:
+            proxy.last_used = now
+        return chosen
     
     async def mark_success(self, proxy: Proxy):
         """Mark proxy request as successful"""
         async with self._lock:
+            previous_rate = proxy.success_rate
             proxy.success_count += 1
+            proxy.update_success_rate()
+            self._sum_rate += proxy.success_rate - previous_rate
+            if self._is_usable(proxy):
+                self._max_rate = max(self._max_rate, proxy.success_rate)
     
     async def mark_failure(self, proxy: Proxy):
         """Mark proxy request as failed"""
         async with self._lock:
+            previous_rate = proxy.success_rate
             proxy.fail_count += 1
+            proxy.update_success_rate()
+            self._sum_rate += proxy.success_rate - previous_rate
             
             # Ban if too many failures
-            if proxy.fail_count >= 5:
-                self._banned.add(proxy.url)
+            if proxy.fail_count >= self.MAX_FAILURES and not proxy.banned:
+                proxy.banned = True
+                self._banned_count += 1
+                self._unindex(proxy)
+            
+            # The rate only dropped, so _max_rate is still an upper bound -
+            # _draw() tightens it lazily instead of rescanning the pool here
+    
+    def _tighten_max_rate(self):
+        """Reset the success-rate bound to the exact max over usable proxies"""
+        self._max_rate = max(
+            (p.success_rate for p in self._proxies if self._is_usable(p)),
+            default=0.0
+        )
+    
+    def _is_usable(self, proxy: Proxy) -> bool:
+        """Check the proxy is neither banned nor over the failure limit"""
+        return not proxy.banned and proxy.fail_count < self.MAX_FAILURES
+    
+    def _index(self, proxy: Proxy):
+        """Add a usable proxy to its candidate lists"""
+        for key in self._keys(proxy):
+            candidates = self._candidates.setdefault(key, [])
+            self._positions[key, id(proxy)] = len(candidates)
+            candidates.append(proxy)
+            self._schedules.pop(key, None)
+        self._max_rate = max(self._max_rate, proxy.success_rate)
+    
+    def _unindex(self, proxy: Proxy):
+        """Remove a proxy from its candidate lists (swap with last, pop - O(1))"""
+        for key in self._keys(proxy):
+            position = self._positions.pop((key, id(proxy)), None)
+            if position is None:
+                continue
+            
+            self._schedules.pop(key, None)
+            candidates = self._candidates[key]
+            last = candidates.pop()
+            if position < len(candidates):
+                candidates[position] = last
+                self._positions[key, id(last)] = position
+    
+    @staticmethod
+    def _keys(proxy: Proxy) -> list[tuple[str, Optional[str]]]:
+        """Candidate list keys a proxy belongs to"""
+        keys = [(proxy.protocol, None)]
+        if proxy.country is not None:
+            keys.append((proxy.protocol, proxy.country))
+        return keys
+    
+    def _rebuild_index(self):
+        """Rebuild the candidate lists from scratch"""
+        self._candidates.clear()
+        self._positions.clear()
+        self._schedules.clear()
+        self._max_rate = 0.0
+        for proxy in self._proxies:
+            if self._is_usable(proxy):
+                self._index(proxy)
     
     async def check_proxy(self, proxy: Proxy) -> bool:
         """
@@ -145,33 +361,38 @@ class ProxyPool:
         Returns:
             Dict with working, failed, banned counts
         """
-        working = 0
-        failed = 0
+        # Checks are I/O-bound - run them concurrently, bounded
+        semaphore = asyncio.Semaphore(self.max_check_concurrency)
         
-        for proxy in self._proxies:
-            if await self.check_proxy(proxy):
-                working += 1
-            else:
-                failed += 1
+        async def check(proxy: Proxy) -> bool:
+            async with semaphore:
+                return await self.check_proxy(proxy)
+        
+        results = await asyncio.gather(*(check(p) for p in self._proxies))
+        working = sum(results)
+        failed = len(results) - working
         
         return {
             "total": len(self._proxies),
             "working": working,
             "failed": failed,
-            "banned": len(self._banned)
+            "banned": self._banned_count
         }
     
     def clear_bans(self):
         """Clear ban list"""
-        self._banned.clear()
+        for proxy in self._proxies:
+            proxy.banned = False
+        self._banned_count = 0
+        self._rebuild_index()
     
     def get_stats(self) -> dict:
         """Get pool statistics"""
         return {
             "total": len(self._proxies),
-            "available": len([p for p in self._proxies if p.url not in self._banned]),
-            "banned": len(self._banned),
-            "avg_success_rate": sum(p.success_rate for p in self._proxies) / len(self._proxies) if self._proxies else 0
+            "available": len(self._proxies) - self._banned_count,
+            "banned": self._banned_count,
+            "avg_success_rate": self._sum_rate / len(self._proxies) if self._proxies else 0
         }
 
 
@@ -183,28 +404,31 @@ class FreeProxyFetcher:
         "https://api.proxyscrape.com/v2/?request=getproxies&protocol=http",
     ]
     
+    # One "host:port" per line (CRLF tolerated)
+    HOST_PORT_PATTERN = re.compile(rb"^[ \t]*([^\s:]+):(\d{1,5})\s*$", re.MULTILINE)
+    
     def __init__(self):
         self.client = httpx.AsyncClient(timeout=30.0)
     
     async def fetch(self) -> list[Proxy]:
-        """Fetch proxies from all sources"""
+        """Fetch proxies from all sources (concurrently)"""
         proxies = []
         
-        for source in self.SOURCES:
-            try:
-                response = await self.client.get(source)
-                if response.status_code == 200:
-                    lines = response.text.strip().split("\n")
-                    for line in lines:
-                        if ":" in line:
-                            parts = line.strip().split(":")
-                            if len(parts) == 2:
-                                proxies.append(Proxy(
-                                    host=parts[0],
-                                    port=int(parts[1])
-                                ))
-            except Exception as e:
-                print(f"Failed to fetch from {source}: {e}")
+        responses = await asyncio.gather(
+            *(self.client.get(source) for source in self.SOURCES),
+            return_exceptions=True
+        )
+        
+        for source, response in zip(self.SOURCES, responses):
+            if isinstance(response, Exception):
+                logger.warning("Failed to fetch from %s: %s", source, response)
+            elif response.status_code == 200:
+                # Match on the raw bytes - no decode or split of the body
+                for match in self.HOST_PORT_PATTERN.finditer(response.content):
+                    proxies.append(Proxy(
+                        host=match.group(1).decode(),
+                        port=int(match.group(2))
+                    ))
         
         return proxies
     
@@ -4,9 +4,16 @@ Bright Data Scraper - Premium Proxy Integration
 Uses Bright Data Web Unlocker for heavily protected sites.
 """
 
+import logging
 import httpx
+from types import MappingProxyType
 from typing import Optional
 from src.config import config
+from src.utils.fast_json import loads
+
+
+# Child of the "scraper" logger set up in src.utils.logging
+logger = logging.getLogger("scraper.bright_data")
 
 
 class BrightDataScraper:
@@ -20,13 +27,23 @@ class BrightDataScraper:
     - Scraping Browser for complex sites
     """
     
+    # Same for every request - shared read-only mapping
+    REQUEST_HEADERS = MappingProxyType({
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+    })
+    
     def __init__(self):
         proxy_url = config.proxy.bright_data_url
         self.proxy = {"http://": proxy_url, "https://": proxy_url} if proxy_url else None
         self.client = httpx.AsyncClient(
             timeout=60.0,
+            http2=True,
             proxy=proxy_url if proxy_url else None
         )
+        # One client per (country, session_id) proxy route, reused across scrapes
+        self._proxy_clients: dict[tuple[str, Optional[str]], httpx.AsyncClient] = {}
     
     def is_configured(self) -> bool:
         """Check if Bright Data is configured"""
@@ -52,18 +69,12 @@ class BrightDataScraper:
         if not self.is_configured():
             raise ValueError("Bright Data not configured. Set BRIGHT_DATA_USERNAME and BRIGHT_DATA_PASSWORD")
         
-        # Build proxy URL with country targeting
-        proxy_url = self._build_proxy_url(country, session_id)
-        
-        async with httpx.AsyncClient(
-            timeout=60.0,
-            proxy=proxy_url
-        ) as client:
-            response = await client.get(
-                url,
-                headers=self._get_headers()
-            )
-            return response.text
+        client = self._get_proxy_client(country, session_id)
+        response = await client.get(
+            url,
+            headers=self.REQUEST_HEADERS
+        )
+        return response.text
     
     async def scrape_serp(
         self, 
@@ -99,13 +110,34 @@ class BrightDataScraper:
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = loads(response.content)
                 return data.get("results", [])
         except Exception as e:
-            print(f"SERP API error: {e}")
+            logger.warning("SERP API error: %s", e)
         
         return []
     
+    def _get_proxy_client(
+        self,
+        country: str = "us",
+        session_id: Optional[str] = None
+    ) -> httpx.AsyncClient:
+        """Get the kept-alive client for a (country, session) proxy route"""
+        key = (country, session_id)
+        client = self._proxy_clients.get(key)
+        
+        if client is None:
+            # Build proxy URL with country targeting
+            client = httpx.AsyncClient(
+                timeout=60.0,
+                http2=True,
+                proxy=self._build_proxy_url(country, session_id),
+                limits=httpx.Limits(max_keepalive_connections=20)
+            )
+            self._proxy_clients[key] = client
+        
+        return client
+    
     def _build_proxy_url(
         self, 
         country: str = "us",
@@ -125,14 +157,9 @@ class BrightDataScraper:
         
         return f"http://{username}:{password}@{host}:{port}"
     
-    def _get_headers(self) -> dict:
-        """Get request headers"""
-        return {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9",
-        }
-    
     async def close(self):
-        """Close HTTP client"""
+        """Close HTTP clients"""
         await self.client.aclose()
+        for client in self._proxy_clients.values():
+            await client.aclose()
+        self._proxy_clients.clear()
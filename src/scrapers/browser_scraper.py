@@ -8,9 +8,68 @@ Supports multiple browser engines:
 """
 
 import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 
+# Dedicated, bounded threads for blocking browser calls - each holds a
+# thread for seconds, so keep them off the loop's default executor
+BROWSER_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="browser")
+
+
+# Settling: after load, poll the DOM size until it stops changing for
+# SETTLE_QUIET_PERIOD seconds (JS rendering done), capped at wait_time
+SETTLE_POLL_INTERVAL = 0.1
+SETTLE_QUIET_PERIOD = 0.5
+DOM_SIZE_SCRIPT = "return document.documentElement ? document.documentElement.innerHTML.length : 0"
+
+
+def _wait_until_settled(run_js, timeout: float):
+    """Block until the page's DOM stops changing, or timeout"""
+    deadline = time.monotonic() + timeout
+    last_size = None
+    stable_since = time.monotonic()
+    
+    while True:
+        now = time.monotonic()
+        try:
+            size = run_js(DOM_SIZE_SCRIPT)
+        except Exception:
+            # Mid-navigation - treat as a change
+            size = None
+        
+        if size != last_size:
+            last_size = size
+            stable_since = now
+        elif now - stable_since >= SETTLE_QUIET_PERIOD:
+            return
+        
+        if now >= deadline:
+            # Return whatever has rendered so far, as the fixed sleep did
+            return
+        time.sleep(SETTLE_POLL_INTERVAL)
+
+
+def _wait_for_webdriver(driver, wait_for: Optional[str], timeout: float):
+    """Wait for a CSS selector if given, else for the DOM to settle"""
+    if not wait_for:
+        _wait_until_settled(driver.execute_script, timeout)
+        return
+    
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+    
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=SETTLE_POLL_INTERVAL).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, wait_for))
+        )
+    except TimeoutException:
+        pass
+
+
 class DrissionPageScraper:
     """
     DrissionPage scraper - lightweight browser automation.
@@ -43,28 +102,38 @@ class DrissionPageScraper:
                 raise ImportError("DrissionPage not installed. Run: pip install DrissionPage")
         return self._page
     
-    async def scrape(self, url: str, wait_time: float = 2.0) -> str:
+    async def scrape(
+        self,
+        url: str,
+        wait_time: float = 2.0,
+        wait_for: Optional[str] = None
+    ) -> str:
         """
         Scrape URL with browser automation.
         
         Args:
             url: URL to scrape
-            wait_time: Time to wait for JS execution
+            wait_time: Maximum time to wait for JS rendering
+            wait_for: CSS selector to wait for (default: until the DOM settles)
         
         Returns:
             HTML content
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._scrape_sync, url, wait_time)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            BROWSER_POOL, self._scrape_sync, url, wait_time, wait_for
+        )
     
-    def _scrape_sync(self, url: str, wait_time: float) -> str:
+    def _scrape_sync(self, url: str, wait_time: float, wait_for: Optional[str]) -> str:
         """Sync scraping method"""
         page = self._get_page()
         page.get(url)
         
-        # Wait for JS
-        import time
-        time.sleep(wait_time)
+        # get() returns at load - wait for rendering, capped at wait_time
+        if wait_for:
+            page.wait.eles_loaded(f"css:{wait_for}", timeout=wait_time)
+        else:
+            _wait_until_settled(page.run_js, wait_time)
         
         return page.html
     
@@ -75,9 +144,9 @@ class DrissionPageScraper:
         scroll: bool = False
     ) -> str:
         """Scrape with custom actions"""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
-            None, 
+            BROWSER_POOL, 
             self._scrape_with_action_sync, 
             url, click_selector, scroll
         )
@@ -92,7 +161,6 @@ class DrissionPageScraper:
         page = self._get_page()
         page.get(url)
         
-        import time
         time.sleep(1)
         
         if click_selector:
@@ -152,27 +220,35 @@ class SeleniumScraper:
                 raise ImportError("Selenium not installed. Run: pip install selenium webdriver-manager")
         return self._driver
     
-    async def scrape(self, url: str, wait_time: float = 2.0) -> str:
+    async def scrape(
+        self,
+        url: str,
+        wait_time: float = 2.0,
+        wait_for: Optional[str] = None
+    ) -> str:
         """
         Scrape URL with Selenium.
         
         Args:
             url: URL to scrape
-            wait_time: Time to wait for JS
+            wait_time: Maximum time to wait for JS rendering
+            wait_for: CSS selector to wait for (default: until the DOM settles)
         
         Returns:
             HTML content
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._scrape_sync, url, wait_time)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            BROWSER_POOL, self._scrape_sync, url, wait_time, wait_for
+        )
     
-    def _scrape_sync(self, url: str, wait_time: float) -> str:
+    def _scrape_sync(self, url: str, wait_time: float, wait_for: Optional[str]) -> str:
         """Sync scraping"""
         driver = self._get_driver()
         driver.get(url)
         
-        import time
-        time.sleep(wait_time)
+        # get() returns at load - wait for rendering, capped at wait_time
+        _wait_for_webdriver(driver, wait_for, wait_time)
         
         return driver.page_source
     
@@ -214,18 +290,25 @@ class UndetectedChromeScraper:
                 raise ImportError("undetected-chromedriver not installed. Run: pip install undetected-chromedriver")
         return self._driver
     
-    async def scrape(self, url: str, wait_time: float = 3.0) -> str:
-        """Scrape with undetected Chrome"""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._scrape_sync, url, wait_time)
+    async def scrape(
+        self,
+        url: str,
+        wait_time: float = 3.0,
+        wait_for: Optional[str] = None
+    ) -> str:
+        """Scrape with undetected Chrome (waits as SeleniumScraper.scrape)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            BROWSER_POOL, self._scrape_sync, url, wait_time, wait_for
+        )
     
-    def _scrape_sync(self, url: str, wait_time: float) -> str:
+    def _scrape_sync(self, url: str, wait_time: float, wait_for: Optional[str]) -> str:
         """Sync scraping"""
         driver = self._get_driver()
         driver.get(url)
         
-        import time
-        time.sleep(wait_time)
+        # get() returns at load - wait for rendering, capped at wait_time
+        _wait_for_webdriver(driver, wait_for, wait_time)
         
         return driver.page_source
     
@@ -5,6 +5,7 @@ Bypasses TLS-based bot detection by impersonating real browser fingerprints.
 """
 
 import random
+from types import MappingProxyType
 from typing import Optional
 
 
@@ -24,6 +25,20 @@ class CurlCffiScraper:
         "firefox120",
     ]
     
+    # Same for every request - shared read-only mapping
+    REQUEST_HEADERS = MappingProxyType({
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Accept-Encoding": "gzip, deflate, br",
+        "DNT": "1",
+        "Connection": "keep-alive",
+        "Upgrade-Insecure-Requests": "1",
+        "Sec-Fetch-Dest": "document",
+        "Sec-Fetch-Mode": "navigate",
+        "Sec-Fetch-Site": "none",
+        "Sec-Fetch-User": "?1",
+    })
+    
     def __init__(self):
         self.current_profile_idx = 0
     
@@ -52,7 +67,7 @@ class CurlCffiScraper:
         async with AsyncSession(impersonate=profile) as session:
             response = await session.get(
                 url,
-                headers=self._get_headers()
+                headers=self.REQUEST_HEADERS
             )
             return response.text
     
@@ -61,18 +76,3 @@ class CurlCffiScraper:
         profile = self.BROWSER_PROFILES[self.current_profile_idx]
         self.current_profile_idx = (self.current_profile_idx + 1) % len(self.BROWSER_PROFILES)
         return profile
-    
-    def _get_headers(self) -> dict:
-        """Get browser-like headers"""
-        return {
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "DNT": "1",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "none",
-            "Sec-Fetch-User": "?1",
-        }
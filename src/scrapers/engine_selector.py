@@ -6,12 +6,39 @@ based on the target site's protection level.
 """
 
 import asyncio
+import re
+from collections import OrderedDict
 from typing import Optional
+from urllib.parse import urlsplit
+from src.extractors.pattern_scanner import PatternScanner
 from src.scrapers.httpx_scraper import HttpxScraper
 from src.scrapers.curl_cffi_scraper import CurlCffiScraper
 from src.protection.detector import detect_protection, ProtectionType
 
 
+BLOCK_INDICATORS = (
+    "cf-browser-verification",
+    "challenge-platform",
+    "captcha",
+    "access denied",
+    "please wait while we verify",
+    "checking your browser",
+    "just a moment",
+    "ddos protection",
+    "bot detection",
+)
+
+# All block indicators in one case-insensitive Hyperscan pass
+BLOCK_SCANNER = PatternScanner([
+    [re.compile("|".join(map(re.escape, BLOCK_INDICATORS)), re.IGNORECASE)]
+])
+
+
+# Hosts remembered with the engine that last got through (LRU)
+HOST_ENGINE_CACHE_SIZE = 1024
+_host_engines: OrderedDict[str, str] = OrderedDict()
+
+
 # Engine instances
 _httpx_scraper = None
 _curl_scraper = None
@@ -59,6 +86,18 @@ async def smart_scrape(
     elif force_engine == "curl":
         return await get_curl_scraper().scrape(url)
     
+    host = urlsplit(url).hostname
+    
+    # Host already needed curl_cffi - skip the httpx attempt
+    if retry_on_block and _host_engines.get(host) == "curl":
+        try:
+            html = await get_curl_scraper().scrape(url)
+            _remember_engine(host, "curl")
+            return html
+        except Exception:
+            # Forget the host and run the full pipeline
+            _host_engines.pop(host, None)
+    
     # Try fastest engine first (httpx)
     try:
         html = await get_httpx_scraper().scrape(url)
@@ -67,35 +106,43 @@ async def smart_scrape(
         if _is_blocked(html):
             if retry_on_block:
                 # Escalate to curl_cffi (TLS fingerprinting)
-                return await get_curl_scraper().scrape(url)
+                html = await get_curl_scraper().scrape(url)
+                _remember_engine(host, "curl")
+                return html
             else:
                 raise Exception("Blocked by protection")
         
+        _remember_engine(host, "httpx")
         return html
     
     except Exception as e:
         if retry_on_block:
             # Try curl_cffi
             try:
-                return await get_curl_scraper().scrape(url)
+                html = await get_curl_scraper().scrape(url)
+                _remember_engine(host, "curl")
+                return html
             except:
                 pass
         raise e
 
 
+def _remember_engine(host: Optional[str], engine: str):
+    """Record the engine that got through for a host"""
+    if host is None:
+        return
+    
+    _host_engines[host] = engine
+    _host_engines.move_to_end(host)
+    if len(_host_engines) > HOST_ENGINE_CACHE_SIZE:
+        _host_engines.popitem(last=False)
+
+
 def _is_blocked(html: str) -> bool:
     """Check if response indicates blocking"""
-    block_indicators = [
-        "cf-browser-verification",
-        "challenge-platform",
-        "captcha",
-        "access denied",
-        "please wait while we verify",
-        "checking your browser",
-        "just a moment",
-        "ddos protection",
-        "bot detection",
-    ]
-    
-    html_lower = html.lower()
-    return any(indicator in html_lower for indicator in block_indicators)
+    regions = BLOCK_SCANNER.scan(html)
+    if regions is None:
+        # No hyperscan - substring checks over the lowercased HTML
+        html_lower = html.lower()
+        return any(indicator in html_lower for indicator in BLOCK_INDICATORS)
+    return bool(regions[0])
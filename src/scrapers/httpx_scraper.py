@@ -7,8 +7,9 @@ Best for unprotected or lightly protected sites.
 
 import asyncio
 import httpx
-from typing import Optional
+from typing import AsyncIterator, Iterable, Optional
 import random
+from types import MappingProxyType
 
 
 class HttpxScraper:
@@ -18,7 +19,7 @@ class HttpxScraper:
     Features:
     - HTTP/2 multiplexing
     - Connection pooling
-    - User agent rotation
+    - Per-session user agent
     - Automatic retries
     """
     
@@ -30,8 +31,19 @@ class HttpxScraper:
     ]
     
     def __init__(self, max_connections: int = 100):
+        # One user agent per session, consistent with the TLS fingerprint
+        self.headers = MappingProxyType({
+            "User-Agent": random.choice(self.USER_AGENTS),
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.9",
+            "Accept-Encoding": "gzip, deflate, br",
+            "DNT": "1",
+            "Connection": "keep-alive",
+            "Upgrade-Insecure-Requests": "1",
+        })
         self.client = httpx.AsyncClient(
             http2=True,
+            headers=self.headers,
             follow_redirects=True,
             timeout=30.0,  # Simple timeout
             limits=httpx.Limits(
@@ -57,52 +69,75 @@ class HttpxScraper:
         Returns:
             HTML content
         """
-        request_headers = self._get_headers()
-        if headers:
-            request_headers.update(headers)
-        
+        # Session headers are set on the client; httpx merges any overrides
         response = await self.client.get(
             url,
-            headers=request_headers,
+            headers=headers,
             cookies=cookies
         )
         response.raise_for_status()
         
         return response.text
     
-    async def scrape_many(self, urls: list[str]) -> list[dict]:
+    async def scrape_many(self, urls: list[str], concurrency: int = 50) -> list[dict]:
         """
         Scrape multiple URLs concurrently.
         
         Args:
             urls: List of URLs to scrape
+            concurrency: Maximum requests in flight
         
         Returns:
-            List of results with url, content, and error
+            List of results with url, content, and error (in input order)
         """
-        tasks = [self.scrape(url) for url in urls]
-        responses = await asyncio.gather(*tasks, return_exceptions=True)
+        # `concurrency` workers pull from a shared iterator, so only that
+        # many requests (and responses) are alive at once
+        results = [None] * len(urls)
+        pending = enumerate(urls)
         
-        results = []
-        for url, response in zip(urls, responses):
-            if isinstance(response, Exception):
-                results.append({"url": url, "error": str(response)})
-            else:
-                results.append({"url": url, "content": response})
+        async def worker():
+            for i, url in pending:
+                results[i] = await self._scrape_result(url)
         
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, len(urls)))))
         return results
     
-    def _get_headers(self) -> dict:
-        """Get request headers with random user agent"""
-        return {
-            "User-Agent": random.choice(self.USER_AGENTS),
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "DNT": "1",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-        }
+    async def iter_many(self, urls: Iterable[str], concurrency: int = 50) -> AsyncIterator[dict]:
+        """
+        Scrape multiple URLs, yielding each result as soon as it completes.
+        
+        Args:
+            urls: URLs to scrape (consumed lazily)
+            concurrency: Maximum requests in flight
+        
+        Yields:
+            Results with url, content, and error (in completion order)
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+        pending = iter(urls)
+        
+        async def worker():
+            for url in pending:
+                await queue.put(await self._scrape_result(url))
+        
+        async def run():
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+            await queue.put(None)
+        
+        runner = asyncio.create_task(run())
+        try:
+            while (result := await queue.get()) is not None:
+                yield result
+        finally:
+            # Stop outstanding requests if the consumer breaks early
+            runner.cancel()
+    
+    async def _scrape_result(self, url: str) -> dict:
+        """Scrape one URL into a result dict, capturing any error"""
+        try:
+            return {"url": url, "content": await self.scrape(url)}
+        except Exception as e:
+            return {"url": url, "error": str(e)}
     
     async def close(self):
         """Close the HTTP client"""
@@ -5,9 +5,24 @@ Uses headless Chrome for JavaScript-heavy sites and protection bypass.
 """
 
 import asyncio
+from contextlib import asynccontextmanager
 from typing import Optional
 
 
+# Resource types aborted on pooled pages when block_resources is set -
+# matched on the request type, so query strings and extensionless
+# asset URLs are caught too
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+
+
+async def _block_resources(route, request):
+    """Route handler aborting static assets the scrape doesn't need"""
+    if request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
 class PlaywrightScraper:
     """
     Browser automation scraper using Playwright.
@@ -17,17 +32,34 @@ class PlaywrightScraper:
     - Resource blocking (images/fonts for speed)
     - Stealth mode integration
     - Screenshot capability
+    - Pool of reusable pages for concurrent scrapes
     """
     
-    def __init__(self, headless: bool = True, block_resources: bool = True):
+    def __init__(
+        self,
+        headless: bool = True,
+        block_resources: bool = True,
+        max_pages: int = 4
+    ):
         self.headless = headless
         self.block_resources = block_resources
+        self.max_pages = max_pages
         self._browser = None
         self._context = None
+        # Warm pages shared by scrape() and scrape_with_scroll() (None
+        # marks a slot whose page is re-created on the next borrow)
+        self._pages: Optional[asyncio.Queue] = None
+        self._launch_lock = asyncio.Lock()
     
     async def _get_browser(self):
-        """Lazy browser initialization"""
-        if self._browser is None:
+        """Lazy browser initialization (pre-warms the page pool)"""
+        if self._browser is not None:
+            return self._browser
+        
+        async with self._launch_lock:
+            if self._browser is not None:
+                return self._browser
+            
             try:
                 from playwright.async_api import async_playwright
                 self._playwright = await async_playwright().start()
@@ -45,8 +77,57 @@ class PlaywrightScraper:
                 )
             except ImportError:
                 raise ImportError("playwright not installed. Run: pip install playwright && playwright install chromium")
+            
+            self._pages = asyncio.Queue()
+            for page in await asyncio.gather(*(self._new_page() for _ in range(self.max_pages))):
+                self._pages.put_nowait(page)
         return self._browser
     
+    async def _new_page(self):
+        """Open a pool page with resource blocking installed once"""
+        page = await self._context.new_page()
+        if self.block_resources:
+            await page.route("**/*", _block_resources)
+        return page
+    
+    @asynccontextmanager
+    async def _pooled_page(self):
+        """Borrow a warm page, returning it blanked (or replaced) afterwards"""
+        await self._get_browser()
+        # Bound here so a page borrowed across close() goes back to its own pool
+        pages = self._pages
+        page = await pages.get()
+        
+        try:
+            if page is None:
+                # Slot whose page was lost earlier - re-create it on borrow
+                page = await self._new_page()
+            yield page
+        finally:
+            # Always refill the slot, or the pool shrinks and get() blocks forever
+            pages.put_nowait(await self._recycle(page))
+    
+    async def _recycle(self, page):
+        """Blank a returned page, replacing it if needed - None if that fails too"""
+        if page is None:
+            return None
+        
+        try:
+            await page.goto("about:blank")
+            return page
+        except Exception:
+            # Crashed or wedged page - swap in a fresh one
+            try:
+                await page.close()
+            except Exception:
+                pass
+        
+        try:
+            return await self._new_page()
+        except Exception:
+            # Browser or context gone - the next borrower retries
+            return None
+    
     async def scrape(
         self, 
         url: str,
@@ -64,35 +145,27 @@ class PlaywrightScraper:
         Returns:
             HTML content
         """
-        await self._get_browser()
-        
-        page = await self._context.new_page()
-        
-        try:
-            # Block resources for speed
-            if self.block_resources:
-                await page.route("**/*.{png,jpg,jpeg,gif,svg,woff,woff2,ttf}", 
-                                lambda route: route.abort())
-            
+        # Pooled pages already block resources for speed
+        async with self._pooled_page() as page:
             # Navigate
             await page.goto(url, timeout=timeout, wait_until="domcontentloaded")
             
-            # Wait for specific element if provided
+            # Wait for specific element if provided, otherwise briefly for
+            # JS-driven requests to settle (instead of a fixed sleep)
             if wait_for:
                 try:
                     await page.wait_for_selector(wait_for, timeout=5000)
                 except:
                     pass
-            
-            # Wait a bit for JS to execute
-            await asyncio.sleep(1)
+            else:
+                try:
+                    await page.wait_for_load_state("networkidle", timeout=2000)
+                except:
+                    pass
             
             # Get content
             content = await page.content()
             return content
-        
-        finally:
-            await page.close()
     
     async def scrape_with_scroll(
         self, 
@@ -111,11 +184,7 @@ class PlaywrightScraper:
         Returns:
             HTML content
         """
-        await self._get_browser()
-        
-        page = await self._context.new_page()
-        
-        try:
+        async with self._pooled_page() as page:
             await page.goto(url, wait_until="domcontentloaded")
             
             for _ in range(scroll_count):
@@ -123,9 +192,6 @@ class PlaywrightScraper:
                 await asyncio.sleep(delay)
             
             return await page.content()
-        
-        finally:
-            await page.close()
     
     async def screenshot(
         self, 
@@ -136,6 +202,7 @@ class PlaywrightScraper:
         """Take screenshot of page"""
         await self._get_browser()
         
+        # Fresh page - screenshots need the images pooled pages block
         page = await self._context.new_page()
         
         try:
@@ -152,3 +219,5 @@ class PlaywrightScraper:
             await self._browser.close()
             await self._playwright.stop()
             self._browser = None
+            self._context = None
+            self._pages = None
@@ -4,24 +4,41 @@ Cache - Redis Caching Layer
 Caches scraped content to avoid duplicate requests.
 """
 
+from functools import lru_cache
 from typing import Optional
-import json
 import hashlib
 
+try:
+    from xxhash import xxh3_64_hexdigest
+except ImportError:
+    xxh3_64_hexdigest = None
+
+
+@lru_cache(maxsize=4096)
+def _url_key(url: str) -> str:
+    """Cache key for a URL (non-cryptographic hash, memoized for repeat probes)"""
+    if xxh3_64_hexdigest:
+        return f"cache:{xxh3_64_hexdigest(url.encode())}"
+    return f"cache:{hashlib.blake2b(url.encode(), digest_size=8).hexdigest()}"
+
 
 class Cache:
     """
     Redis-based caching.
     
     Features:
-    - URL-based cache keys
+    - URL-based cache keys (64-bit xxh3, or blake2b without xxhash)
     - Configurable TTL
-    - JSON serialization
+    - Raw string values
+    
+    Keys used to be md5 hex digests - entries written under that scheme
+    are never read again and simply expire after their TTL.
     """
     
-    def __init__(self, ttl_hours: int = 24):
+    def __init__(self, ttl_hours: int = 24, client=None):
         self.ttl = ttl_hours * 3600
-        self._redis = None
+        # Optional existing redis.asyncio client, to share its connection pool
+        self._redis = client
     
     async def _get_redis(self):
         """Lazy Redis connection"""
@@ -29,7 +46,12 @@ class Cache:
             try:
                 import redis.asyncio as redis
                 from src.config import config
-                self._redis = await redis.from_url(config.database.redis_url)
+                self._redis = redis.from_url(
+                    config.database.redis_url,
+                    max_connections=64,
+                    health_check_interval=30,
+                    socket_keepalive=True
+                )
             except Exception as e:
                 print(f"Redis connection failed: {e}")
                 return None
@@ -37,7 +59,7 @@ class Cache:
     
     def _url_to_key(self, url: str) -> str:
         """Convert URL to cache key"""
-        return f"cache:{hashlib.md5(url.encode()).hexdigest()}"
+        return _url_key(url)
     
     async def get(self, url: str) -> Optional[str]:
         """Get cached content for URL"""
@@ -65,6 +87,38 @@ class Cache:
         except:
             return False
     
+    async def mget(self, urls: list[str]) -> list[Optional[str]]:
+        """Get cached content for many URLs in one round-trip"""
+        redis = await self._get_redis()
+        if not redis or not urls:
+            return [None] * len(urls)
+        
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                for url in urls:
+                    pipe.get(self._url_to_key(url))
+                values = await pipe.execute()
+            return [data.decode() if data else None for data in values]
+        except:
+            return [None] * len(urls)
+    
+    async def mset(self, items: dict[str, str]) -> bool:
+        """Cache content for many URLs in one round-trip"""
+        redis = await self._get_redis()
+        if not redis:
+            return False
+        if not items:
+            return True
+        
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                for url, content in items.items():
+                    pipe.setex(self._url_to_key(url), self.ttl, content)
+                await pipe.execute()
+            return True
+        except:
+            return False
+    
     async def exists(self, url: str) -> bool:
         """Check if URL is cached"""
         redis = await self._get_redis()
@@ -5,10 +5,11 @@ Stores extracted data in Supabase (PostgreSQL).
 """
 
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timezone
 from pydantic import BaseModel
 import httpx
 from src.config import config
+from src.utils.fast_json import loads, dumps
 
 
 class Entity(BaseModel):
@@ -58,7 +59,11 @@ class Database:
                 "Authorization": f"Bearer {self.key}",
                 "Content-Type": "application/json",
                 "Prefer": "return=representation"
-            }
+            },
+            # Multiplex concurrent writes from worker bursts over one connection
+            http2=True,
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+            timeout=httpx.Timeout(10.0, connect=5.0)
         ) if self.url and self.key else None
     
     def is_configured(self) -> bool:
@@ -70,24 +75,56 @@ class Database:
         if not self.is_configured():
             return None
         
-        data = entity.model_dump(exclude={"id"})
-        data["scraped_at"] = datetime.utcnow().isoformat()
+        data = entity.model_dump(mode="json", exclude={"id", "scraped_at"})
+        data["scraped_at"] = datetime.now(timezone.utc).isoformat()
         
-        response = await self.client.post("/entities", json=data)
+        response = await self.client.post("/entities", content=dumps(data))
         if response.status_code == 201:
-            result = response.json()
+            result = loads(response.content)
             return result[0]["id"] if result else None
         return None
     
+    async def save_entities_bulk(self, entities: list[Entity]) -> list[str]:
+        """Save many entities in one request (array insert)"""
+        scraped_at = datetime.now(timezone.utc).isoformat()
+        return await self._insert_many("/entities", [
+            entity.model_dump(mode="json", exclude={"id", "scraped_at"}) | {"scraped_at": scraped_at}
+            for entity in entities
+        ])
+    
+    async def save_contacts_bulk(self, contacts: list[Contact]) -> list[str]:
+        """Save many contacts in one request (array insert)"""
+        return await self._insert_many(
+            "/contacts",
+            [contact.model_dump(mode="json", exclude={"id"}) for contact in contacts]
+        )
+    
+    async def save_socials_bulk(self, socials: list[SocialAccount]) -> list[str]:
+        """Save many social media accounts in one request (array insert)"""
+        return await self._insert_many(
+            "/social_accounts",
+            [social.model_dump(mode="json", exclude={"id"}) for social in socials]
+        )
+    
+    async def _insert_many(self, table: str, rows: list[dict]) -> list[str]:
+        """POST rows as one JSON array and return the new ids in order"""
+        if not self.is_configured() or not rows:
+            return []
+        
+        response = await self.client.post(table, content=dumps(rows))
+        if response.status_code == 201:
+            return [row["id"] for row in loads(response.content)]
+        return []
+    
     async def save_contact(self, contact: Contact) -> Optional[str]:
         """Save contact information"""
         if not self.is_configured():
             return None
         
-        data = contact.model_dump(exclude={"id"})
-        response = await self.client.post("/contacts", json=data)
+        data = contact.model_dump(mode="json", exclude={"id"})
+        response = await self.client.post("/contacts", content=dumps(data))
         if response.status_code == 201:
-            result = response.json()
+            result = loads(response.content)
             return result[0]["id"] if result else None
         return None
     
@@ -96,10 +133,10 @@ class Database:
         if not self.is_configured():
             return None
         
-        data = social.model_dump(exclude={"id"})
-        response = await self.client.post("/social_accounts", json=data)
+        data = social.model_dump(mode="json", exclude={"id"})
+        response = await self.client.post("/social_accounts", content=dumps(data))
         if response.status_code == 201:
-            result = response.json()
+            result = loads(response.content)
             return result[0]["id"] if result else None
         return None
     
@@ -113,7 +150,7 @@ class Database:
             params={"url": f"eq.{url}"}
         )
         if response.status_code == 200:
-            result = response.json()
+            result = loads(response.content)
             if result:
                 return Entity(**result[0])
         return None
@@ -0,0 +1,25 @@
+"""
+Fast JSON - orjson with stdlib fallback
+
+loads() accepts str or bytes (e.g. response.content) and dumps()
+always returns UTF-8 bytes, whichever backend is installed.
+"""
+
+import json
+
+try:
+    import orjson
+    from orjson import loads
+except ImportError:
+    orjson = None
+    from json import loads
+
+
+def dumps(obj, indent: bool = False) -> bytes:
+    """Serialize obj to JSON bytes (compact, or 2-space indented)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
@@ -4,14 +4,92 @@ Logging - Structured Logging
 Provides structured logging for the scraper.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 from src.config import config
 
 
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that flushes in batches instead of after every record.
+    
+    Records are written to the file object's buffer and flushed once
+    `capacity` records are pending, `flush_interval` seconds have passed,
+    or a record at `flush_level` or above arrives - so failures reach
+    disk immediately. A timer flushes whatever is still pending
+    `flush_interval` seconds after a write, so an idle process doesn't
+    hold back the tail of a burst. Output is line-for-line the same as
+    FileHandler.
+    """
+    
+    def __init__(
+        self,
+        filename,
+        capacity: int = 200,
+        flush_interval: float = 1.0,
+        flush_level: int = logging.WARNING,
+        **kwargs
+    ):
+        super().__init__(filename, **kwargs)
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self._timer: Optional[threading.Timer] = None
+    
+    def emit(self, record: logging.LogRecord):
+        # StreamHandler.emit flushes every record - write without it
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+            return
+        
+        self._pending += 1
+        now = time.monotonic()
+        if (
+            self._pending >= self.capacity
+            or record.levelno >= self.flush_level
+            or now - self._last_flush >= self.flush_interval
+        ):
+            self._flush_pending(now)
+        elif self._timer is None:
+            # Flush the rest of this burst even if nothing else is logged
+            self._timer = threading.Timer(self.flush_interval, self._flush_stale)
+            self._timer.daemon = True
+            self._timer.start()
+    
+    def _flush_pending(self, now: float):
+        """Flush buffered records (called with the handler lock held)"""
+        self.flush()
+        self._pending = 0
+        self._last_flush = now
+    
+    def _flush_stale(self):
+        """Timer callback - flush records still buffered"""
+        with self.lock:
+            self._timer = None
+            if self._pending:
+                self._flush_pending(time.monotonic())
+    
+    def close(self):
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        super().close()
+
 def setup_logger(
     name: str = "scraper",
     level: str = "INFO",
@@ -20,6 +98,10 @@ def setup_logger(
     """
     Set up structured logger.
     
+    Records are only enqueued on the calling thread; a QueueListener
+    thread does the console and file writes, so logging from async
+    scrape paths never blocks the event loop on I/O.
+    
     Args:
         name: Logger name
         level: Log level (DEBUG, INFO, WARNING, ERROR)
@@ -40,14 +122,24 @@ def setup_logger(
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # File handler (if specified)
     if log_file:
         log_file.parent.mkdir(exist_ok=True)
-        file_handler = logging.FileHandler(log_file)
+        file_handler = BufferedFileHandler(log_file)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # Hot path enqueues; the listener thread drains to the real handlers
+    records = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(records))
+    listener = logging.handlers.QueueListener(records, *handlers)
+    listener.start()
+    
+    # Kept on the logger for shutdown; stop() flushes what is queued
+    logger.listener = listener
+    atexit.register(listener.stop)
     
     return logger
 
@@ -82,30 +174,33 @@ class ScrapeLogger:
         self.logger.info("=" * 50)
         self.logger.info("Scraping session started")
     
+    # Messages pass their values as logging args, so nothing is formatted
+    # when the level is filtered out
+    
     def log_scrape(self, url: str, success: bool, details: str = ""):
         """Log a scrape attempt"""
         if success:
             self._stats["scraped"] += 1
-            self.logger.info(f"✅ Scraped: {url[:60]} {details}")
+            self.logger.info("✅ Scraped: %s %s", url[:60], details)
         else:
             self._stats["failed"] += 1
-            self.logger.warning(f"❌ Failed: {url[:60]} {details}")
+            self.logger.warning("❌ Failed: %s %s", url[:60], details)
     
     def log_blocked(self, url: str, protection: str = "unknown"):
         """Log blocked request"""
         self._stats["blocked"] += 1
-        self.logger.warning(f"🚫 Blocked: {url[:60]} ({protection})")
+        self.logger.warning("🚫 Blocked: %s (%s)", url[:60], protection)
     
     def log_extract(self, url: str, data_type: str, count: int):
         """Log extraction"""
-        self.logger.info(f"📦 Extracted {count} {data_type} from {url[:50]}")
+        self.logger.info("📦 Extracted %d %s from %s", count, data_type, url[:50])
     
     def log_error(self, message: str, exc: Optional[Exception] = None):
         """Log error"""
         if exc:
-            self.logger.error(f"💥 Error: {message} - {exc}")
+            self.logger.error("💥 Error: %s - %s", message, exc)
         else:
-            self.logger.error(f"💥 Error: {message}")
+            self.logger.error("💥 Error: %s", message)
     
     def end_session(self) -> dict:
         """End session and return stats"""
@@ -6,16 +6,25 @@ Processes scrape jobs from Redis queue.
 
 import asyncio
 from typing import Optional
-import json
+from src.utils.fast_json import loads, dumps
 
 
-async def run_worker(concurrency: int = 10, queue_name: str = "scrape_queue"):
+# Tries at requeueing unfinished jobs and pushing results on shutdown
+SHUTDOWN_ATTEMPTS = 3
+
+
+async def run_worker(
+    concurrency: int = 10,
+    queue_name: str = "scrape_queue",
+    batch_size: int = 10
+):
     """
     Run the 24/7 worker process.
     
     Args:
-        concurrency: Number of parallel workers
+        concurrency: Number of jobs processed in parallel
         queue_name: Redis queue to process
+        batch_size: Jobs popped (and probed in the cache) or results flushed at once
     """
     try:
         import redis.asyncio as redis
@@ -25,28 +34,36 @@ async def run_worker(concurrency: int = 10, queue_name: str = "scrape_queue"):
     
     from src.config import config
     from src.scrapers.engine_selector import smart_scrape
-    from src.extractors.email_extractor import EmailExtractor
-    from src.extractors.social_extractor import SocialExtractor
+    from src.extractors.page_extractor import PageExtractor
+    from src.storage.cache import Cache
     
-    # Connect to Redis
-    r = redis.from_url(config.database.redis_url)
+    # Connect to Redis - one pool for the queue and the cache, sized for
+    # the consumers plus the producer's and flusher's pipelines
+    r = redis.from_url(
+        config.database.redis_url,
+        max_connections=max(64, concurrency * 2),
+        health_check_interval=30,
+        socket_keepalive=True
+    )
+    cache = Cache(client=r)
     
-    email_extractor = EmailExtractor()
-    social_extractor = SocialExtractor()
+    # Bound method, resolved once rather than per job
+    extract_page = PageExtractor().extract
     
     print(f"🔄 Worker started with {concurrency} concurrent tasks")
     print(f"   Listening on queue: {queue_name}")
     
-    async def process_job(job_data: dict) -> dict:
-        """Process a single job"""
+    async def process_job(job_data: dict, html: Optional[str], fresh: dict[str, str]) -> dict:
+        """Process a single job, scraping unless cached HTML was found"""
         url = job_data.get("url")
         if not url:
             return {"error": "No URL provided"}
         
         try:
-            html = await smart_scrape(url)
-            emails = email_extractor.extract(html)
-            social = social_extractor.extract(html)
+            if html is None:
+                html = await smart_scrape(url)
+                fresh[url] = html
+            emails, social = extract_page(html)
             
             return {
                 "url": url,
@@ -61,43 +78,157 @@ async def run_worker(concurrency: int = 10, queue_name: str = "scrape_queue"):
                 "error": str(e)
             }
     
-    # Semaphore for concurrency control
-    semaphore = asyncio.Semaphore(concurrency)
+    # Popped jobs (bounded - the producer waits while consumers are busy)
+    # and finished results awaiting a batched flush
+    jobs: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+    results: asyncio.Queue = asyncio.Queue()
+    # Freshly scraped HTML not yet written to the cache
+    fresh: dict[str, str] = {}
+    # Work taken off Redis but not finished - requeued on shutdown:
+    # popped jobs not yet handed to `jobs`, and jobs being processed
+    unqueued: list[tuple[dict, Optional[str]]] = []
+    in_flight: dict[int, dict] = {}
+    # Results being pushed (kept until the push succeeds)
+    outbox: list[dict] = []
+    results_key = f"{queue_name}:results"
+    
+    def decode_job(payload) -> Optional[dict]:
+        """Decode one queued job, None (and skipped) if it isn't {"url": str, ...}"""
+        try:
+            job = loads(payload)
+        except Exception as e:
+            print(f"Worker error: bad job payload: {e}")
+            return None
+        
+        if not isinstance(job, dict) or not isinstance(job.get("url"), str):
+            print(f"Worker error: job without a URL: {payload[:100]!r}")
+            return None
+        return job
+    
+    def drain(queue: asyncio.Queue) -> list:
+        """Take everything currently in a queue"""
+        items = []
+        while not queue.empty():
+            items.append(queue.get_nowait())
+        return items
+    
+    async def producer():
+        """Pop jobs in batches and probe the cache for each batch at once"""
+        while True:
+            try:
+                # Hand over anything left from an interrupted batch first
+                while unqueued:
+                    await jobs.put(unqueued[0])
+                    del unqueued[0]
+                
+                # Blocking pop for the first job, then drain up to a batch
+                popped = await r.blpop(queue_name, timeout=5)
+                if not popped:
+                    continue
+                
+                _, job_json = popped
+                payloads = [job_json]
+                if batch_size > 1:
+                    payloads += await r.lpop(queue_name, batch_size - 1) or []
+                
+                batch = [job for job in map(decode_job, payloads) if job is not None]
+                if not batch:
+                    continue
+                
+                unqueued.extend((job, None) for job in batch)
+                cached = await cache.mget([job["url"] for job in batch])
+                unqueued[:] = zip(batch, cached)
+                while unqueued:
+                    await jobs.put(unqueued[0])
+                    del unqueued[0]
+            
+            except Exception as e:
+                print(f"Worker error: {e}")
+                await asyncio.sleep(1)
     
-    async def worker():
-        """Worker loop"""
+    async def consumer():
+        """Process jobs one at a time"""
         while True:
-            async with semaphore:
-                try:
-                    # Blocking pop from queue
-                    result = await r.blpop(queue_name, timeout=5)
-                    
-                    if result:
-                        _, job_json = result
-                        job = json.loads(job_json)
-                        
-                        # Process
-                        result = await process_job(job)
-                        
-                        # Push result
-                        await r.rpush(
-                            f"{queue_name}:results",
-                            json.dumps(result)
-                        )
-                        
-                        status = "✅" if result.get("success") else "❌"
-                        print(f"{status} Processed: {job.get('url', 'N/A')[:50]}")
+            job, html = await jobs.get()
+            in_flight[id(job)] = job
+            try:
+                result = await process_job(job, html, fresh)
                 
-                except Exception as e:
-                    print(f"Worker error: {e}")
-                    await asyncio.sleep(1)
+                status = "✅" if result.get("success") else "❌"
+                print(f"{status} Processed: {(job.get('url') or 'N/A')[:50]}")
+                results.put_nowait(result)
+            except Exception as e:
+                # A bad job must not take the consumer (and the worker) down
+                print(f"Worker error: {e}")
+            finally:
+                jobs.task_done()
+            # Not reached when cancelled mid-job - shutdown requeues it
+            del in_flight[id(job)]
     
-    # Run workers
-    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    async def flush():
+        """Write new cache entries and push the outbox"""
+        pending = dict(fresh)
+        fresh.clear()
+        await cache.mset(pending)
+        
+        if outbox:
+            await r.rpush(results_key, *(dumps(result) for result in outbox))
+            outbox.clear()
+    
+    async def flusher():
+        """Push finished results and new cache entries in batches"""
+        delay = 1
+        while True:
+            if not outbox:
+                outbox.append(await results.get())
+            while not results.empty() and len(outbox) < batch_size:
+                outbox.append(results.get_nowait())
+            
+            try:
+                await flush()
+                delay = 1
+            except Exception as e:
+                # Keep the batch and retry it with backoff
+                print(f"Worker error: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30)
+    
+    async def shutdown(workers: list[asyncio.Task]):
+        """Stop the tasks, requeue unfinished jobs and flush what's done"""
+        for w in workers:
+            w.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        
+        # Unfinished jobs go back to the head of the queue, in order
+        requeue = [
+            *in_flight.values(),
+            *(job for job, _ in drain(jobs)),
+            *(job for job, _ in unqueued)
+        ]
+        outbox.extend(drain(results))
+        
+        # A few attempts - nothing retries after this
+        for attempt in range(SHUTDOWN_ATTEMPTS):
+            try:
+                if requeue:
+                    await r.lpush(queue_name, *(dumps(job) for job in reversed(requeue)))
+                    requeue = []
+                await flush()
+                return
+            except Exception as e:
+                print(f"Worker error: shutdown flush failed: {e}")
+                await asyncio.sleep(2 ** attempt)
+    
+    # One producer and flusher around `concurrency` consumers
+    workers = [
+        asyncio.create_task(producer()),
+        asyncio.create_task(flusher()),
+        *(asyncio.create_task(consumer()) for _ in range(concurrency))
+    ]
     
     try:
         await asyncio.gather(*workers)
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
         print("\n👋 Shutting down worker...")
-        for w in workers:
-            w.cancel()
+    finally:
+        await shutdown(workers)
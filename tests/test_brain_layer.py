@@ -6,44 +6,58 @@ import pytest
 import asyncio
 from src.brain.brain_layer import BrainLayer
 from src.brain.search_aggregator import SearchAggregator
+from src.brain.score_cache import ScoreCache
 from src.extractors.email_extractor import EmailExtractor
 from src.extractors.social_extractor import SocialExtractor
+from src.extractors.contact_extractor import ContactExtractor
+from src.extractors.page_extractor import PageExtractor
+from src.proxy.proxy_pool import ProxyPool, Proxy
+from src.protection import detector
+from src.protection.detector import ProtectionType, detect_protection
+
+
+# Extractors are stateless - share one instance per module
+@pytest.fixture(scope="module")
+def email_extractor():
+    return EmailExtractor()
+
+
+@pytest.fixture(scope="module")
+def social_extractor():
+    return SocialExtractor()
 
 
 class TestEmailExtractor:
     """Test email extraction"""
     
-    def test_extract_valid_emails(self):
-        extractor = EmailExtractor()
+    def test_extract_valid_emails(self, email_extractor):
         content = """
         Contact us at info@example.org or sales@company.com
         Support: help@website.net
         """
-        emails = extractor.extract(content)
+        emails = email_extractor.extract(content)
         
         assert "info@example.org" in emails
         assert "sales@company.com" in emails
         assert "help@website.net" in emails
     
-    def test_filter_invalid_emails(self):
-        extractor = EmailExtractor()
+    def test_filter_invalid_emails(self, email_extractor):
         content = """
         Invalid: test@example.com (filtered domain)
         Image: logo.png@style.css (not an email)
         """
-        emails = extractor.extract(content)
+        emails = email_extractor.extract(content)
         
         # example.com is in ignore list
         assert "test@example.com" not in emails
     
-    def test_deduplicate_emails(self):
-        extractor = EmailExtractor()
+    def test_deduplicate_emails(self, email_extractor):
         content = """
         info@company.com
         INFO@COMPANY.COM
         info@company.com
         """
-        emails = extractor.extract(content)
+        emails = email_extractor.extract(content)
         
         assert len(emails) == 1
         assert "info@company.com" in emails
@@ -52,39 +66,96 @@ class TestEmailExtractor:
 class TestSocialExtractor:
     """Test social media extraction"""
     
-    def test_extract_twitter(self):
-        extractor = SocialExtractor()
+    def test_extract_twitter(self, social_extractor):
         content = '''
         <a href="https://twitter.com/username">Twitter</a>
         <a href="https://x.com/anotheruser">X</a>
         '''
-        social = extractor.extract(content)
+        social = social_extractor.extract(content)
         
         assert "twitter" in social
         assert len(social["twitter"]) >= 1
     
-    def test_extract_instagram(self):
-        extractor = SocialExtractor()
+    def test_extract_instagram(self, social_extractor):
         content = '''
         <a href="https://instagram.com/brand">Instagram</a>
         '''
-        social = extractor.extract(content)
+        social = social_extractor.extract(content)
         
         assert "instagram" in social
     
-    def test_filter_generic_links(self):
-        extractor = SocialExtractor()
+    def test_filter_generic_links(self, social_extractor):
         content = '''
         <a href="https://twitter.com/share">Share</a>
         <a href="https://twitter.com/intent">Intent</a>
         '''
-        social = extractor.extract(content)
+        social = social_extractor.extract(content)
         
         # share and intent should be filtered
         if "twitter" in social:
             assert "https://twitter.com/share" not in social["twitter"]
 
 
+class TestPageExtractor:
+    """Test combined email + social extraction"""
+    
+    def test_matches_separate_extractors(self):
+        content = '''
+        <p>Write to sales@company.com or SALES@COMPANY.COM</p>
+        <a href="https://x.com/company">X</a>
+        <a href="https://twitter.com/share">Share</a>
+        <a href="https://instagram.com/company.shop/">Instagram</a>
+        '''
+        emails, social = PageExtractor().extract(content)
+        
+        assert emails == EmailExtractor().extract(content)
+        assert social == SocialExtractor().extract(content)
+    
+    @pytest.mark.parametrize("content", [
+        '''
+        <p>Café Größe – schreiben Sie an büro@firma.de oder İnfo@firma.de</p>
+        <a href="https://x.com/größe">X</a>
+        <a href="https://instagram.com/café_shop">Instagram</a>
+        ''',
+        # ı and ſ fold onto ASCII letters under re.IGNORECASE
+        '''
+        <p>Mail ınfo@ſhop.com or sales@shop.com</p>
+        <a href="https://twitter.com/ſhop">X</a>
+        ''',
+    ])
+    def test_non_ascii_matches_full_scan(self, content, monkeypatch):
+        emails, social = PageExtractor().extract(content)
+        
+        # Same results as the stdlib patterns over the full content,
+        # whichever engines (Hyperscan, RE2) are installed
+        monkeypatch.setattr(EmailExtractor, "EMAIL_MATCHER", EmailExtractor.EMAIL_PATTERN)
+        monkeypatch.setattr(SocialExtractor, "MATCHERS", dict(SocialExtractor.PATTERNS))
+        assert emails == EmailExtractor().extract_regions([content])
+        assert social == SocialExtractor().extract_scanned(content, None)
+
+
+class TestContactExtractor:
+    """Test phone extraction"""
+    
+    def test_extract_formatted_phone(self):
+        extractor = ContactExtractor()
+        phones = extractor.extract_phones("<p>Call us: (555) 123-4567</p>")
+        
+        assert "(555) 123-4567" in phones
+    
+    def test_extract_non_ascii_address(self):
+        extractor = ContactExtractor()
+        contacts = extractor.extract_all("<p>12 Größe Street, Berlin, BE 12345</p>")
+        
+        assert "12 Größe Street, Berlin, BE 12345" in contacts["addresses"]
+    
+    def test_reject_unformatted_digit_run(self):
+        extractor = ContactExtractor()
+        
+        assert not extractor._is_valid_phone("5551234567")
+        assert extractor._is_valid_phone("555-123-4567")
+
+
 class TestBrainLayer:
     """Test brain layer discovery"""
     
@@ -96,6 +167,7 @@ class TestBrainLayer:
             {"url": "https://example.com/page"},
             {"url": "https://example.com/page/"},
             {"url": "https://example.com/page?ref=1"},
+            {"url": "https://example.com/page#contact"},
         ]
         
         unique = brain._deduplicate(results)
@@ -117,5 +189,180 @@ class TestBrainLayer:
         assert filtered[0]["url"] == "https://cameras.com"
 
 
+class TestScoreCache:
+    """Test LLM score caching"""
+    
+    @pytest.mark.asyncio
+    async def test_exact_hit(self):
+        cache = ScoreCache()
+        results = [
+            {"url": "https://cameras.com", "title": "Vintage Camera Shop"},
+            {"url": "https://random.com", "title": "Random Site"},
+        ]
+        
+        await cache.store("vintage cameras", results[:1], [0.9])
+        
+        # Query is normalized before lookup
+        scores = await cache.lookup("  Vintage   CAMERAS ", results)
+        assert scores == [0.9, None]
+
+
+class TestProxyPool:
+    """Test weighted proxy selection"""
+    
+    @staticmethod
+    def make_pool(strategy: str = "stochastic", seed: int = 42) -> ProxyPool:
+        pool = ProxyPool(strategy=strategy)
+        pool._rng.seed(seed)
+        return pool
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("strategy", ProxyPool.STRATEGIES)
+    async def test_never_returns_banned_or_failing(self, strategy):
+        pool = self.make_pool(strategy)
+        good = [Proxy(host=f"good{i}", port=8080) for i in range(10)]
+        # Still the best rate once banned - must be dropped, not just down-weighted
+        good[0].success_count = 50
+        good[0].update_success_rate()
+        pool.add_proxies(good)
+        pool.add_proxy(Proxy(host="banned", port=8080, banned=True))
+        pool.add_proxy(Proxy(host="failing", port=8080, fail_count=ProxyPool.MAX_FAILURES))
+        
+        # Failures ban a proxy that was already in the candidate lists
+        for _ in range(ProxyPool.MAX_FAILURES):
+            await pool.mark_failure(good[0])
+        
+        picks = {(await pool.get_proxy()).host for _ in range(500)}
+        assert picks <= {p.host for p in good[1:]}
+    
+    @pytest.mark.asyncio
+    async def test_country_filter_after_removals(self):
+        pool = self.make_pool()
+        # High success counts keep banned proxies attractive if left indexed
+        proxies = [
+            Proxy(host=f"proxy{i}", port=8080, country="US" if i % 2 else "DE", success_count=20)
+            for i in range(20)
+        ]
+        pool.add_proxies(proxies)
+        
+        # Ban from the front so removals swap the last proxies into place,
+        # then ban some of the swapped-in proxies too
+        for proxy in [*proxies[:8], proxies[-1], proxies[-2]]:
+            for _ in range(ProxyPool.MAX_FAILURES):
+                await pool.mark_failure(proxy)
+        
+        for country in ("US", "DE"):
+            for _ in range(200):
+                proxy = await pool.get_proxy(country=country)
+                assert proxy.country == country
+                assert not proxy.banned
+        
+        assert len(pool._candidates["http", None]) == 10
+    
+    @pytest.mark.asyncio
+    async def test_sample_k_distinct(self):
+        pool = self.make_pool()
+        pool.add_proxies([Proxy(host=f"proxy{i}", port=8080) for i in range(10)])
+        
+        sample = await pool.sample_k(5)
+        assert len(sample) == 5
+        assert len({id(p) for p in sample}) == 5
+        
+        # Asking for more than the pool holds returns every proxy once
+        assert len({id(p) for p in await pool.sample_k(50)}) == 10
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("strategy", ProxyPool.STRATEGIES)
+    async def test_picks_follow_success_rate(self, strategy):
+        pool = self.make_pool(strategy)
+        strong = Proxy(host="strong", port=8080, success_count=8, fail_count=2)
+        weak = Proxy(host="weak", port=8080, success_count=2, fail_count=3)
+        pool.add_proxies([strong, weak])
+        
+        picks = [(await pool.get_proxy()).host for _ in range(5000)]
+        
+        # Rates 0.8 vs 0.4 - strong should win about two thirds of picks
+        share = picks.count("strong") / len(picks)
+        assert 0.62 < share < 0.71
+
+
+class TestProtectionDetector:
+    """Test detection caching and request coalescing"""
+    
+    @pytest.fixture
+    def fake_detect(self, monkeypatch):
+        """Replace the network fetch with a counted, controllable fake"""
+        monkeypatch.setattr(detector, "_detections", {})
+        monkeypatch.setattr(detector, "_in_flight", {})
+        calls = []
+        state = {"result": ProtectionType.CLOUDFLARE, "error": None, "delay": 0.01}
+        
+        async def _detect(url):
+            calls.append(url)
+            await asyncio.sleep(state["delay"])
+            if state["error"]:
+                raise state["error"]
+            return state["result"]
+        
+        monkeypatch.setattr(detector, "_detect", _detect)
+        return calls, state
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_request(self, fake_detect):
+        calls, _ = fake_detect
+        results = await asyncio.gather(*(detect_protection("https://a.com") for _ in range(10)))
+        
+        assert results == [ProtectionType.CLOUDFLARE] * 10
+        assert calls == ["https://a.com"]
+    
+    @pytest.mark.asyncio
+    async def test_result_reused_within_ttl(self, fake_detect, monkeypatch):
+        calls, state = fake_detect
+        await detect_protection("https://a.com")
+        
+        state["result"] = ProtectionType.NONE
+        assert await detect_protection("https://a.com") == ProtectionType.CLOUDFLARE
+        assert len(calls) == 1
+        
+        # Expired entries are detected again
+        monkeypatch.setattr(detector, "DETECTION_TTL", 0.0)
+        assert await detect_protection("https://a.com") == ProtectionType.NONE
+        assert len(calls) == 2
+    
+    @pytest.mark.asyncio
+    async def test_failure_returns_unknown_uncached(self, fake_detect):
+        calls, state = fake_detect
+        state["error"] = ConnectionError("down")
+        assert await detect_protection("https://a.com") == ProtectionType.UNKNOWN
+        
+        state["error"] = None
+        assert await detect_protection("https://a.com") == ProtectionType.CLOUDFLARE
+        assert len(calls) == 2
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self, fake_detect):
+        calls, state = fake_detect
+        state["delay"] = 0.05
+        callers = [asyncio.create_task(detect_protection("https://a.com")) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        callers[0].cancel()
+        
+        results = await asyncio.gather(*callers, return_exceptions=True)
+        
+        assert isinstance(results[0], asyncio.CancelledError)
+        assert results[1:] == [ProtectionType.CLOUDFLARE] * 2
+        assert len(calls) == 1
+    
+    @pytest.mark.asyncio
+    async def test_oldest_entry_evicted(self, fake_detect, monkeypatch):
+        calls, _ = fake_detect
+        monkeypatch.setattr(detector, "DETECTION_CACHE_SIZE", 2)
+        for url in ("https://a.com", "https://b.com", "https://c.com"):
+            await detect_protection(url)
+        await asyncio.sleep(0)
+        
+        assert list(detector._detections) == ["https://b.com", "https://c.com"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])